@@ -0,0 +1,93 @@
+# auditlog.py
+import asyncio
+import json
+import time
+import discord
+from discord import app_commands
+from fileio import run_io
+
+BLUE = 0x0000FF
+EMBED_LIMIT = 4096  # Max characters in an embed description
+
+class AuditLog:
+    """Buffered sink for command audit events, flushed in batches to bot_logs and a local file"""
+
+    def __init__(self, bot, channel_id, log_file="audit.log", flush_interval=5, batch_size=20, max_queue=1000):
+        self.bot = bot
+        self.channel_id = channel_id
+        self.log_file = log_file
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.logged = 0
+        self.dropped = 0
+        self._reported_drops = 0
+        self._task = None
+
+    def record(self, user, command):
+        """Queue an audit event without waiting on any I/O"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        try:
+            self.queue.put_nowait({
+                "time": int(time.time()),
+                "user_id": user.id,
+                "user": str(user),
+                "command": command
+            })
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    def _write_file(self, batch):
+        with open(self.log_file, "a") as f:
+            f.writelines(json.dumps(event) + "\n" for event in batch)
+
+    async def _flush(self, batch):
+        self.logged += len(batch)
+        try:
+            await run_io(self._write_file, batch)
+        except Exception as e:
+            print(f"Failed to write audit log: {e}")
+
+        log_channel = self.bot.get_channel(self.channel_id)
+        if not log_channel:
+            return
+
+        # Pack lines into as few embeds as the description limit allows
+        chunks = [""]
+        dropped = self.dropped - self._reported_drops
+        if dropped:
+            self._reported_drops = self.dropped
+            chunks[-1] = f"⚠️ {dropped} audit events dropped (queue full, {self.dropped} total)\n"
+        for event in batch:
+            line = f"<t:{event['time']}:T> User: <@{event['user_id']}>, Command: {event['command']}\n"
+            if len(chunks[-1]) + len(line) > EMBED_LIMIT:
+                chunks.append("")
+            chunks[-1] += line
+        try:
+            for chunk in chunks:
+                await log_channel.send(embed=discord.Embed(description=chunk, color=BLUE))
+        except Exception as e:
+            print(f"Failed to log commands: {e}")
+
+class AuditedCommandTree(app_commands.CommandTree):
+    """Command tree that queues an audit event for every app command"""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        await self.client.log_command_usage(interaction)
+        return True
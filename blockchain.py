@@ -0,0 +1,480 @@
+# blockchain.py
+import asyncio
+import json
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from urllib.parse import urlsplit
+import aiohttp
+from fileio import run_io
+
+# ----------------------
+# CONSTANTS & CONFIG
+# ----------------------
+BLOCKCYPHER_TX_URL = "https://api.blockcypher.com/v1/ltc/main/txs/{}"
+BLOCKCYPHER_BATCH_SIZE = 3  # Hashes per batched request allowed without an API token
+BLOCKCYPHER_IO_LIMIT = 100  # Inputs/outputs per response, BlockCypher returns only 20 by default
+BLOCKCYPHER_OUTPUT_PAGES = 5  # Extra next_outputs requests allowed per transaction
+BLOCKCHAIR_TX_URL = "https://api.blockchair.com/litecoin/dashboards/transactions/{}"
+BLOCKCHAIR_BATCH_SIZE = 10
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price?ids=litecoin&vs_currencies=usd,inr,eur"
+CONFIRMATIONS_REQUIRED = 6  # Transactions with this many confirmations never change
+DEFAULT_TIMEOUTS = {
+    "api.blockcypher.com": 10,
+    "api.blockchair.com": 10,
+    "api.coingecko.com": 5
+}
+
+# ----------------------
+# HTTP CLIENT
+# ----------------------
+class HttpClient:
+    """Shared aiohttp session with keep-alive pooling, per-host timeouts and retries"""
+
+    def __init__(self, timeouts=None, default_timeout=10, retries=2, backoff=0.5):
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.default_timeout = default_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._session = None
+
+    def _get_session(self):
+        # Created lazily so the session binds to the running event loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def get_json(self, url):
+        host = urlsplit(url).hostname
+        timeout = aiohttp.ClientTimeout(total=self.timeouts.get(host, self.default_timeout))
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._get_session().get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except aiohttp.ClientResponseError as e:
+                if e.status != 429 and e.status < 500 or attempt == self.retries:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+# ----------------------
+# TRANSACTION PROVIDERS
+# ----------------------
+class TxProvider(ABC):
+    """Source of normalised LTC transaction data"""
+    # Transactions are {"hash", "confirmations", "time", "inputs", "outputs", "output_count"},
+    # with time an ISO 8601 UTC string (or None), inputs/outputs lists of {"addresses", "value"}
+    # and output_count the transaction's real number of outputs, which may exceed len(outputs)
+
+    name = "provider"
+    batch_size = 1
+
+    @abstractmethod
+    async def fetch(self, tx_id):
+        """Fetch one transaction, raising if it can't be found"""
+
+    async def fetch_many(self, tx_ids):
+        """Fetch several transactions, skipping any that fail"""
+        results = await asyncio.gather(*(self.fetch(tx_id) for tx_id in tx_ids), return_exceptions=True)
+        return [tx for tx in results if not isinstance(tx, Exception)]
+
+def parse_blockcypher_tx(data):
+    """Normalise a BlockCypher transaction"""
+    outputs = [
+        {"addresses": output.get("addresses") or [], "value": output.get("value", 0)}
+        for output in data.get("outputs", [])
+    ]
+    return {
+        "hash": data.get("hash"),
+        "confirmations": data.get("confirmations", 0),
+        "time": data.get("confirmed") or data.get("received"),
+        "inputs": [
+            {"addresses": tx_input.get("addresses") or [], "value": tx_input.get("output_value", 0)}
+            for tx_input in data.get("inputs", [])
+        ],
+        "outputs": outputs,
+        "output_count": max(data.get("vout_sz", 0), len(outputs))
+    }
+
+class BlockCypherProvider(TxProvider):
+    name = "blockcypher"
+    batch_size = BLOCKCYPHER_BATCH_SIZE
+
+    def __init__(self, http):
+        self.http = http
+
+    @staticmethod
+    def _url(tx_ids, outstart=0):
+        url = f"{BLOCKCYPHER_TX_URL.format(';'.join(tx_ids))}?limit={BLOCKCYPHER_IO_LIMIT}"
+        return f"{url}&outstart={outstart}" if outstart else url
+
+    async def _add_output_pages(self, data):
+        """Follow next_outputs so large transactions aren't cut off at the first page"""
+        for _ in range(BLOCKCYPHER_OUTPUT_PAGES):
+            if not data.get("next_outputs"):
+                break
+            try:
+                page = await self.http.get_json(self._url([data["hash"]], outstart=len(data["outputs"])))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Keep what we have, output_count still shows that some are missing
+                print(f"Failed to fetch more outputs for {data['hash']}: {e}")
+                break
+            if not page.get("outputs"):
+                break
+            data["outputs"].extend(page["outputs"])
+            data["next_outputs"] = page.get("next_outputs")
+        return parse_blockcypher_tx(data)
+
+    async def fetch(self, tx_id):
+        return await self._add_output_pages(await self.http.get_json(self._url([tx_id])))
+
+    async def fetch_many(self, tx_ids):
+        # One request for the whole batch via BlockCypher's ; separated endpoint
+        data = await self.http.get_json(self._url(tx_ids))
+        return list(await asyncio.gather(*(self._add_output_pages(tx) for tx in (data if isinstance(data, list) else [data]))))
+
+class BlockchairProvider(TxProvider):
+    name = "blockchair"
+    batch_size = BLOCKCHAIR_BATCH_SIZE
+
+    def __init__(self, http):
+        self.http = http
+
+    @staticmethod
+    def parse(tx_hash, data, best_block):
+        tx = data["transaction"]
+        block_id = tx.get("block_id", -1)
+        return {
+            "hash": tx_hash,
+            "confirmations": best_block - block_id + 1 if block_id >= 0 else 0,
+            "time": tx["time"].replace(" ", "T") + "Z" if tx.get("time") else None,
+            "inputs": [
+                {"addresses": [tx_input["recipient"]] if tx_input.get("recipient") else [], "value": tx_input.get("value", 0)}
+                for tx_input in data.get("inputs", [])
+            ],
+            "outputs": [
+                {"addresses": [output["recipient"]] if output.get("recipient") else [], "value": output.get("value", 0)}
+                for output in data.get("outputs", [])
+            ],
+            "output_count": max(tx.get("output_count", 0), len(data.get("outputs", [])))
+        }
+
+    async def fetch_many(self, tx_ids):
+        response = await self.http.get_json(BLOCKCHAIR_TX_URL.format(",".join(tx_ids)))
+        best_block = response.get("context", {}).get("state", 0)
+        data = response.get("data") or {}
+        return [self.parse(tx_hash, tx, best_block) for tx_hash, tx in data.items()]
+
+    async def fetch(self, tx_id):
+        txs = await self.fetch_many([tx_id])
+        if not txs:
+            raise LookupError(f"Transaction {tx_id} not found")
+        return txs[0]
+
+class FixtureProvider(TxProvider):
+    """Serves BlockCypher-format JSON files named <hash>.json from a directory, for offline runs"""
+
+    name = "fixture"
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _load(self, tx_id):
+        # Only a bare hash may name a fixture, never a path out of the directory
+        if not re.fullmatch(r"[0-9a-fA-F]{64}", tx_id):
+            raise FileNotFoundError(tx_id)
+        with open(os.path.join(self.directory, f"{tx_id.lower()}.json"), "r") as f:
+            return json.load(f)
+
+    async def fetch(self, tx_id):
+        try:
+            return parse_blockcypher_tx(await run_io(self._load, tx_id))
+        except FileNotFoundError:
+            raise LookupError(f"No fixture for transaction {tx_id}")
+
+class FailoverProvider(TxProvider):
+    """Primary provider backed by a secondary one, hedged after hedge_delay seconds"""
+
+    def __init__(self, primary, secondary, hedge_delay=2.0):
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_delay = hedge_delay
+        self.name = f"{primary.name}+{secondary.name}"
+        self.batch_size = min(primary.batch_size, secondary.batch_size)
+
+    async def _hedged(self, primary_call, secondary_call):
+        loop = asyncio.get_running_loop()
+        primary_task = loop.create_task(primary_call())
+        pending = {primary_task}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if done and not primary_task.exception():
+                return primary_task.result()
+
+            pending.add(loop.create_task(secondary_call()))
+            error = primary_task.exception() if done else None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.exception():
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch(self, tx_id):
+        return await self._hedged(lambda: self.primary.fetch(tx_id), lambda: self.secondary.fetch(tx_id))
+
+    async def fetch_many(self, tx_ids):
+        return await self._hedged(lambda: self.primary.fetch_many(tx_ids), lambda: self.secondary.fetch_many(tx_ids))
+
+def make_provider(http, config):
+    """Build the transaction provider selected in config.yaml"""
+    name = config.get("ltc_provider", "blockcypher")
+    if name == "fixture":
+        return FixtureProvider(config.get("ltc_fixture_dir", "fixtures"))
+
+    providers = {"blockcypher": BlockCypherProvider, "blockchair": BlockchairProvider}
+    primary = providers[name](http)
+    if not config.get("ltc_failover", True):
+        return primary
+    secondary = next(cls(http) for key, cls in providers.items() if key != name)
+    return FailoverProvider(primary, secondary, hedge_delay=config.get("ltc_hedge_delay", 2.0))
+
+def receiver_outputs(tx):
+    """Return the outputs that don't pay back to an input address (change)"""
+    input_addresses = {address for tx_input in tx["inputs"] for address in tx_input["addresses"]}
+    return [output for output in tx["outputs"] if input_addresses.isdisjoint(output["addresses"])]
+
+async def get_transaction(provider, cache, tx_id):
+    """Return normalised transaction data, from the cache when possible"""
+    tx = cache.get(tx_id)
+    if tx is None:
+        tx = await provider.fetch(tx_id)
+        cache.put(tx_id, tx)
+    return tx
+
+async def fetch_ltc_prices(http):
+    """Fetch the LTC price in USD, INR and EUR from CoinGecko"""
+    data = await http.get_json(COINGECKO_PRICE_URL)
+    return data['litecoin']
+
+# ----------------------
+# TRANSACTION CACHE
+# ----------------------
+class TxCache:
+    """LRU cache of parsed transactions, bounded in entries and bytes, with confirmation-aware TTLs"""
+
+    def __init__(self, max_entries=256, max_bytes=2_000_000, confirmed_ttl=86400, pending_ttl=20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.confirmed_ttl = confirmed_ttl
+        self.pending_ttl = pending_ttl
+        self.size = 0
+        self._entries = OrderedDict()  # hash -> (expires_at, size, tx)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, tx_hash):
+        _, size, _ = self._entries.pop(tx_hash)
+        self.size -= size
+
+    def get(self, tx_hash):
+        tx_hash = tx_hash.lower()
+        entry = self._entries.get(tx_hash)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(tx_hash)
+            return None
+        self._entries.move_to_end(tx_hash)
+        return entry[2]
+
+    def put(self, tx_hash, tx):
+        tx_hash = tx_hash.lower()
+        size = len(json.dumps(tx))
+        if size > self.max_bytes:
+            return
+        if tx_hash in self._entries:
+            self._remove(tx_hash)
+        confirmed = tx["confirmations"] >= CONFIRMATIONS_REQUIRED
+        ttl = self.confirmed_ttl if confirmed else self.pending_ttl
+        self._entries[tx_hash] = (time.monotonic() + ttl, size, tx)
+        self.size += size
+        # Evict least recently used entries until both bounds hold
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+# ----------------------
+# PRICE CACHE
+# ----------------------
+class PriceCache:
+    """LTC exchange rates cached for ttl seconds and refreshed in the background"""
+
+    def __init__(self, http, ttl=60, refresh_ahead=0.8, retry_after=30):
+        self.http = http
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.retry_after = retry_after
+        self.prices = None
+        self.fetched_at = 0
+        self.failed_at = None
+        self.last_error = None
+        self._refresh_task = None
+
+    async def _refresh(self):
+        try:
+            self.prices = await fetch_ltc_prices(self.http)
+        except Exception as e:
+            self.failed_at = time.monotonic()
+            self.last_error = e
+            raise
+        self.fetched_at = time.monotonic()
+        self.failed_at = None
+
+    def _start_refresh(self):
+        # Concurrent callers share one in-flight refresh
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh())
+            self._refresh_task.add_done_callback(self._log_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_failure(task):
+        if not task.cancelled() and task.exception():
+            print(f"Failed to refresh LTC prices: {task.exception()}")
+
+    def _backing_off(self, now):
+        return self.failed_at is not None and now - self.failed_at < self.retry_after
+
+    async def get(self):
+        """Return (prices, stale) where stale means the prices are past their TTL"""
+        now = time.monotonic()
+        if self.prices is None:
+            if self._backing_off(now):
+                raise RuntimeError(f"LTC price API unavailable: {self.last_error}")
+            await asyncio.shield(self._start_refresh())
+            return self.prices, False
+
+        age = now - self.fetched_at
+        if age >= self.ttl * self.refresh_ahead and not self._backing_off(now):
+            self._start_refresh()
+        return self.prices, age >= self.ttl
+
+# ----------------------
+# TRANSACTION WATCHER
+# ----------------------
+class TxWatcher:
+    """Single background poller for every transaction being watched"""
+
+    def __init__(self, provider, cache, on_update, min_interval=30, max_interval=300, max_age=21600):
+        self.provider = provider
+        self.cache = cache
+        self.on_update = on_update
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_age = max_age
+        self.watches = {}  # hash -> watch state
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def watch(self, tx, message):
+        """Start (or join) the watch for a transaction and its =txid message"""
+        tx_hash = tx["hash"].lower()
+        now = time.monotonic()
+        state = self.watches.get(tx_hash)
+        if state is None:
+            state = self.watches[tx_hash] = {
+                "tx": tx,
+                "messages": [],
+                "confirmations": tx["confirmations"],
+                "interval": self.min_interval,
+                "next_poll": now + self.min_interval,
+                "expires": now + self.max_age
+            }
+            # The loop may be sleeping until a backed-off watch is due
+            self._wakeup.set()
+        state["messages"].append(message)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _notify(self, tx, messages, watching=True):
+        try:
+            await self.on_update(tx, messages, watching)
+        except Exception as e:
+            print(f"Failed to update watched transaction: {e}")
+
+    def _back_off(self, state, now):
+        state["interval"] = min(state["interval"] * 2, self.max_interval)
+        state["next_poll"] = now + state["interval"]
+
+    async def _poll(self, tx_hashes):
+        try:
+            results = await self.provider.fetch_many(tx_hashes)
+        except Exception as e:
+            print(f"Failed to poll watched transactions: {e}")
+            results = []
+
+        now = time.monotonic()
+        pending = set(tx_hashes)
+        for tx in results:
+            tx_hash = (tx["hash"] or "").lower()
+            state = self.watches.get(tx_hash)
+            if state is None:
+                continue
+            pending.discard(tx_hash)
+            self.cache.put(tx_hash, tx)
+            state["tx"] = tx
+
+            changed = tx["confirmations"] != state["confirmations"]
+            if changed:
+                state["confirmations"] = tx["confirmations"]
+                await self._notify(tx, state["messages"])
+
+            if tx["confirmations"] >= CONFIRMATIONS_REQUIRED:
+                del self.watches[tx_hash]
+            elif changed:
+                state["interval"] = self.min_interval
+                state["next_poll"] = now + self.min_interval
+            else:
+                self._back_off(state, now)
+
+        # Failed lookups back off the same way as unchanged ones
+        for tx_hash in pending:
+            if tx_hash in self.watches:
+                self._back_off(self.watches[tx_hash], now)
+
+    async def _run(self):
+        while self.watches:
+            self._wakeup.clear()
+            now = time.monotonic()
+            for tx_hash in [h for h, state in self.watches.items() if state["expires"] <= now]:
+                # Drop the watching note from the embeds of an expired watch
+                state = self.watches.pop(tx_hash)
+                await self._notify(state["tx"], state["messages"], watching=False)
+
+            due = [h for h, state in self.watches.items() if state["next_poll"] <= now]
+            batch_size = self.provider.batch_size
+            for start in range(0, len(due), batch_size):
+                await self._poll(due[start:start + batch_size])
+
+            if self.watches:
+                next_wake = min(min(state["next_poll"], state["expires"]) for state in self.watches.values())
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(next_wake - time.monotonic(), 0))
+                except asyncio.TimeoutError:
+                    pass
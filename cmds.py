@@ -14,9 +14,6 @@ def setup(bot):
         *Usage: =add <user or role mention/id>*
         """
         try:
-            # Log command usage
-            await ctx.bot.log_command_usage(ctx)
-
             # Check permissions and context
             if not ctx.guild:
                 return await ctx.send("This command only works in servers!")
@@ -99,9 +96,6 @@ def setup(bot):
         *Usage: =remove <user or role mention/id>*
         """
         try:
-            # Log command usage
-            await ctx.bot.log_command_usage(ctx)
-
             # Check permissions and context
             if not ctx.guild:
                 return await ctx.send("This command only works in servers!")
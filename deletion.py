@@ -0,0 +1,141 @@
+# deletion.py
+import asyncio
+import discord
+from datetime import timedelta
+
+# ----------------------
+# CONSTANTS & CONFIG
+# ----------------------
+DELETE_WORKERS = 3  # Concurrent delete requests
+PROGRESS_INTERVAL = 3  # Seconds between progress message edits
+BULK_DELETE_LIMIT = 100  # Messages per bulk delete request
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)  # Discord rejects older, keep a margin
+
+class DeletionStats:
+    """Running counts for a deletion job"""
+
+    def __init__(self):
+        self.found = 0
+        self.deleted = 0
+        self.failed = 0
+
+# ----------------------
+# DELETION ENGINE
+# ----------------------
+async def delete_messages(messages, workers=DELETE_WORKERS, on_progress=None, progress_interval=PROGRESS_INTERVAL, stats=None):
+    """Delete messages from an async iterator through a bounded worker pool"""
+    stats = stats or DeletionStats()
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=workers * 2)
+
+    async def work():
+        while True:
+            message = await queue.get()
+            try:
+                await message.delete()
+                stats.deleted += 1
+            except discord.NotFound:
+                pass  # Already gone
+            except Exception as e:
+                # Network errors too: a dead worker would leave the queue stuck
+                stats.failed += 1
+                print(f"Error deleting message: {e}")
+            finally:
+                queue.task_done()
+
+    worker_tasks = [loop.create_task(work()) for _ in range(workers)]
+
+    async def while_workers_alive(awaitable):
+        """Await a queue operation, giving up if every worker has exited"""
+        task = loop.create_task(awaitable)
+        alive = {worker for worker in worker_tasks if not worker.done()}
+        while alive and not task.done():
+            done, _ = await asyncio.wait({task, *alive}, return_when=asyncio.FIRST_COMPLETED)
+            alive -= done
+        if not task.done():
+            task.cancel()
+            raise RuntimeError("All delete workers stopped")
+        return task.result()
+
+    async def report():
+        while True:
+            await asyncio.sleep(progress_interval)
+            try:
+                await on_progress(stats)
+            except discord.HTTPException:
+                pass
+
+    reporter = loop.create_task(report()) if on_progress else None
+    try:
+        error = None
+        try:
+            async for message in messages:
+                stats.found += 1
+                await while_workers_alive(queue.put(message))
+        except Exception as e:
+            error = e
+        # Let the workers drain before surfacing a history error (e.g. Forbidden)
+        await while_workers_alive(queue.join())
+        if error:
+            raise error
+    finally:
+        for worker in worker_tasks:
+            worker.cancel()
+        if reporter:
+            reporter.cancel()
+        await asyncio.gather(*worker_tasks, return_exceptions=True)
+    return stats
+
+async def purge_messages(channel, messages, workers=DELETE_WORKERS, on_progress=None, progress_interval=PROGRESS_INTERVAL):
+    """Delete channel messages, bulk deleting those young enough to allow it"""
+    stats = DeletionStats()
+    cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+    old_messages = asyncio.Queue(maxsize=workers * 2)
+
+    async def old():
+        while (message := await old_messages.get()) is not None:
+            yield message
+
+    async def bulk_delete(batch):
+        try:
+            await channel.delete_messages(batch)
+            stats.deleted += len(batch)
+        except discord.NotFound:
+            pass  # Already gone
+        except Exception as e:
+            stats.failed += len(batch)
+            print(f"Error bulk deleting messages: {e}")
+
+    async def partition():
+        batch = []
+        try:
+            async for message in messages:
+                if message.created_at < cutoff:
+                    await old_messages.put(message)
+                    continue
+                stats.found += 1
+                batch.append(message)
+                if len(batch) == BULK_DELETE_LIMIT:
+                    await bulk_delete(batch)
+                    batch = []
+            if batch:
+                await bulk_delete(batch)
+        finally:
+            await old_messages.put(None)
+
+    loop = asyncio.get_running_loop()
+    partition_task = loop.create_task(partition())
+    delete_task = loop.create_task(delete_messages(old(), workers, on_progress, progress_interval, stats))
+    try:
+        done, _ = await asyncio.wait({partition_task, delete_task}, return_when=asyncio.FIRST_EXCEPTION)
+        # The partitioner always ends old() with a sentinel, unless the deletes
+        # failed, in which case it could block on the full queue and is cancelled
+        if delete_task not in done or not delete_task.exception():
+            await asyncio.wait({partition_task, delete_task})
+    finally:
+        partition_task.cancel()
+        delete_task.cancel()
+    for task in (partition_task, delete_task):
+        if not task.cancelled() and task.exception():
+            raise task.exception()
+    return stats
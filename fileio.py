@@ -0,0 +1,36 @@
+# fileio.py
+import asyncio
+import functools
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# ----------------------
+# I/O EXECUTOR
+# ----------------------
+# One worker keeps disk writes in submission order and lets SQLite
+# connections be shared safely, since only this thread ever uses them.
+io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot-io")
+
+async def run_io(func, *args, **kwargs):
+    """Run a blocking file or database call on the I/O thread"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(io_executor, functools.partial(func, *args, **kwargs))
+
+# ----------------------
+# ATOMIC WRITES
+# ----------------------
+def atomic_write_json(path, data, **kwargs):
+    """Write JSON to a temp file next to path, then rename it into place"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, **kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
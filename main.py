@@ -1,8 +1,13 @@
 # ----------------------
 # IMPORTS & DEPENDENCIES
 # ----------------------
-import os
+# Dependencies are installed from requirements.txt, never at runtime
+import time
+startup_began = time.perf_counter()  # --check times each startup phase from here
+
 import sys
+import hashlib
+import json
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -10,41 +15,47 @@ from discord.app_commands import CheckFailure
 import asyncio
 import yaml
 from datetime import datetime, timedelta, timezone
-import time
-import requests
-import re
-import math
 from queue_commands import register_commands
-from discord.utils import get
-from remindersystem import load_reminders, delayed_send_reminder, send_reminder, setup as reminders_setup  # Added imports
+from auditlog import AuditLog, AuditedCommandTree
+from blockchain import HttpClient, PriceCache, TxCache, TxWatcher, make_provider, get_transaction, receiver_outputs, CONFIRMATIONS_REQUIRED
+from deletion import delete_messages, purge_messages
+from fileio import run_io, atomic_write_json
+from snapshots import SnapshotStore, capture_channel, restore_channel
+from remindersystem import start_reminders, setup as reminders_setup  # Added imports
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml, much faster when available
+except ImportError:
+    from yaml import SafeLoader
 
 # ----------------------
-# DEPENDENCY CHECKS
+# STARTUP TIMING
 # ----------------------
-required_modules = [
-    "discord",
-    "pyyaml",
-    "asyncio",
-    "requests"
-]
-
-for module in required_modules:
-    try:
-        __import__(module)
-    except ImportError:
-        os.system(f"{sys.executable} -m pip install {module}")
+startup_phases = []  # (phase, seconds) in the order they completed
+CHECK_MODE = "--check" in sys.argv  # Time startup without side effects, then exit
+CHECK_SKIPPED = ("command tree sync", "reminder delivery")
+
+def mark_phase(name):
+    """Record how long the startup phase that just finished took"""
+    global startup_began
+    now = time.perf_counter()
+    startup_phases.append((name, now - startup_began))
+    startup_began = now
+
+mark_phase("imports")
 
 # ----------------------
 # CONFIGURATION LOADING
 # ----------------------
 try:
     with open("config.yaml", "r") as file:
-        config = yaml.safe_load(file)
-        # REMINDERS_FILE removed as per changes
+        config = yaml.load(file, Loader=SafeLoader)
 except Exception as e:
     print(f"Failed to load config: {e}")
     sys.exit(1)
 
+mark_phase("config")
+
 # ----------------------
 # BOT CONFIGURATION
 # ----------------------
@@ -52,6 +63,10 @@ token = config["token"]
 prefix = config["prefix"]
 client_role = config["client_role"]
 BLUE = 0x0000FF  # Consistent blue color for all embeds
+EMBED_FIELD_LIMIT = 1024  # Max characters in an embed field value
+RECEIVER_CHAR_BUDGET = 4000  # Receiver output characters per =txid embed, within the 6000 total
+DM_FETCH_SIZE = 100  # History messages per request while paging /get_dms
+DM_WINDOW = 50  # Message summaries each /get_dms paginator keeps in memory
 bot_logs = config["bot_logs"]
 admin_role = config["admin_role"]
 queue_channel = config["queue_channel"]
@@ -62,17 +77,73 @@ CATEGORY_MESSAGES = config["CATEGORY_MESSAGES"]
 # ----------------------
 # BOT INITIALIZATION
 # ----------------------
+# Prefix commands need message content; members lets =add/=remove resolve raw user IDs
+MINIMAL_INTENTS = ("guilds", "guild_messages", "dm_messages", "message_content", "members")
+
+def build_intents(profile):
+    """Gateway intents from config: "minimal", "all" or a list of discord.Intents flag names"""
+    if profile == "all":
+        return discord.Intents.all()
+    names = MINIMAL_INTENTS if profile in (None, "minimal") else profile
+    return discord.Intents(**{name: True for name in names})
+
+def build_member_cache(policy, intents):
+    """Member cache from config: "minimal", "all" or a list of discord.MemberCacheFlags names"""
+    if policy == "all":
+        return discord.MemberCacheFlags.from_intents(intents)
+    if policy in (None, "minimal"):
+        # Commands get members from interaction and message payloads, so keep none around
+        return discord.MemberCacheFlags.none()
+    return discord.MemberCacheFlags(**{name: True for name in policy})
+
 start_time = datetime.now()
-intents = discord.Intents.all()
-bot = commands.Bot(command_prefix=prefix, intents=intents)
+intents = build_intents(config.get("intents", "minimal"))
+bot = commands.Bot(
+    command_prefix=prefix,
+    intents=intents,
+    member_cache_flags=build_member_cache(config.get("member_cache", "minimal"), intents),
+    chunk_guilds_at_startup=config.get("chunk_guilds_at_startup", False),
+    tree_cls=AuditedCommandTree
+)
+bot.config = config
+
+# Shared HTTP client for external APIs, closed together with the bot
+bot.web_client = HttpClient(timeouts=config.get("http_timeouts"))
+bot.tx_provider = make_provider(bot.web_client, config)
+bot.price_cache = PriceCache(bot.web_client, ttl=config.get("ltc_price_ttl", 60))
+bot.tx_cache = TxCache(
+    max_entries=config.get("tx_cache_entries", 256),
+    max_bytes=config.get("tx_cache_bytes", 2_000_000),
+    confirmed_ttl=config.get("tx_cache_confirmed_ttl", 86400),
+    pending_ttl=config.get("tx_cache_pending_ttl", 20)
+)
+bot.tx_watcher = TxWatcher(
+    bot.tx_provider,
+    bot.tx_cache,
+    on_update=lambda data, messages, watching: update_watched_tx(data, messages, watching),
+    min_interval=config.get("tx_watch_min_interval", 30),
+    max_interval=config.get("tx_watch_max_interval", 300)
+)
+_close_bot = bot.close
+
+async def close_bot():
+    await bot.web_client.close()
+    await _close_bot()
+
+bot.close = close_bot
 
 # Setup reminder system after bot initialization
 reminders_setup(bot)
 
+# Channel snapshots taken before =nuke, restorable with =restore
+bot.snapshots = SnapshotStore(config.get("snapshot_dir", "snapshots"), config.get("snapshot_keep", 20))
+
 # Remove conflicting default commands
 bot.remove_command('help')
 bot.remove_command('info')
 
+mark_phase("bot setup")
+
 # ----------------------
 # CONSTANTS - Role emojis for userinfo command
 # ----------------------
@@ -91,36 +162,67 @@ role_emojis = {
     "✧༝ client": ("<:hb_client:1354457991537233960>", "Client")
 }
 
+# ----------------------
+# COMMAND TREE SYNC
+# ----------------------
+def command_tree_hash(tree):
+    """Hash the app command payload that tree.sync() would upload"""
+    payload = []
+    for command in tree.get_commands():
+        try:
+            payload.append(command.to_dict(tree))
+        except TypeError:  # discord.py before 2.4 takes no tree argument
+            payload.append(command.to_dict())
+    payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+def read_json(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+async def sync_command_tree():
+    """Sync app commands only when the tree changed since the last sync (delete the hash file to force one)"""
+    path = config.get("command_hash_file", "command_tree.json")
+    state = {"application_id": bot.application_id, "hash": command_tree_hash(bot.tree)}
+    if await run_io(read_json, path) == state:
+        print('Command tree unchanged, skipping sync')
+        return
+    synced = await bot.tree.sync()
+    await run_io(atomic_write_json, path, state)
+    print(f'Synced {len(synced)} commands')
+
 # ----------------------
 # EVENT HANDLERS
 # ----------------------
 @bot.event
-async def on_ready():
-    print(f'Logged in as {bot.user} (ID: {bot.user.id})')
-    print('------')
-    
+async def setup_hook():
+    """Register commands once per process, before the gateway connects"""
     try:
-        # Load and schedule existing reminders
-        reminders = load_reminders()
-        current_time = time.time()
-        
-        for reminder in reminders[:]:  # Iterate over a copy
-            remaining_time = reminder['end_time'] - current_time
-            if remaining_time > 0:
-                bot.loop.create_task(delayed_send_reminder(bot, reminder, remaining_time))
-            else:
-                # Schedule immediate sending without blocking
-                bot.loop.create_task(delayed_send_reminder(bot, reminder, 0))
-        
-        # Removed save_reminders call as per changes (handled by remindersystem)
-        
-        # Register commands
         register_commands(bot)
         from cmds import setup
         setup(bot)
-        
-        synced = await bot.tree.sync()
-        print(f'Synced {len(synced)} commands')
+
+        if not CHECK_MODE:
+            await sync_command_tree()
+    except Exception as e:
+        print(f'Error during startup: {e}')
+
+@bot.event
+async def on_ready():
+    print(f'Logged in as {bot.user} (ID: {bot.user.id})')
+    print('------')
+
+    # --check disconnects right after READY, which would cancel reminder sends
+    # after their rows were already deleted
+    if CHECK_MODE:
+        return
+
+    try:
+        # Deliver overdue reminders and schedule the rest (once, not on every reconnect)
+        start_reminders(bot)
     except Exception as e:
         print(f'Error during startup: {e}')
 
@@ -145,10 +247,6 @@ async def on_app_command_error(interaction: discord.Interaction, error: discord.
 async def log_command_usage(ctx_or_interaction):
     """Handle both Context and Interaction objects for logging"""
     try:
-        log_channel = bot.get_channel(bot_logs)
-        if not log_channel:
-            return
-
         if isinstance(ctx_or_interaction, commands.Context):
             user = ctx_or_interaction.author
             command = f"{prefix}{ctx_or_interaction.command.name}" if ctx_or_interaction.command else "!"
@@ -156,96 +254,219 @@ async def log_command_usage(ctx_or_interaction):
             user = ctx_or_interaction.user
             command = f"/{ctx_or_interaction.command.name}" if ctx_or_interaction.command else "!"
 
-        embed = discord.Embed(
-            description=f"User: {user.mention}, Command: {command}",
-            color=BLUE
-        )
-        await log_channel.send(embed=embed)
+        # Only queues the event, the audit log posts it in the next batch
+        bot.audit_log.record(user, command)
     except Exception as e:
         print(f"Failed to log command: {e}")
 
 # Assign to bot instance
+bot.audit_log = AuditLog(
+    bot,
+    bot_logs,
+    log_file=config.get("audit_log_file", "audit.log"),
+    flush_interval=config.get("audit_flush_interval", 5),
+    batch_size=config.get("audit_batch_size", 20),
+    max_queue=config.get("audit_queue_size", 1000)
+)
 bot.log_command_usage = log_command_usage
 
+# Log every prefix command once, before it runs (app commands are logged by AuditedCommandTree)
+bot.before_invoke(log_command_usage)
+
 class DMPaginator(discord.ui.View):
-    def __init__(self, messages, user):
+    """Pages through the bot's DMs with a user, fetching history as the user navigates"""
+
+    def __init__(self, channel, user, limit):
         super().__init__(timeout=300)
-        self.messages = messages  # Messages ordered: [newest, ..., oldest]
+        self.channel = channel
         self.user = user
+        self.limit = limit  # History messages to look through, bot's or not
+        self.window = []  # Summaries ordered: [newest, ..., oldest]
+        self.window_start = 0  # Index of window[0] among the bot's messages
+        self.scan_cursor = None  # (id, position) of the oldest history message scanned
+        self.exhausted = False  # No older bot messages within limit
+        self.total = None  # Known once the end of history has been reached
         self.current_index = 0
-        self.total = len(messages)
-        self.update_buttons()
-
-    def update_buttons(self):
-        self.first_button.disabled = (self.current_index == 0)
-        self.prev_button.disabled = (self.current_index == 0)
-        self.next_button.disabled = (self.current_index == self.total - 1)
-        self.last_button.disabled = (self.current_index == self.total - 1)
+        self.lock = asyncio.Lock()  # Button callbacks run concurrently, go_to awaits fetches
 
-    def format_content(self, message):
+    @staticmethod
+    def format_content(message):
         """Format message content with truncation if needed"""
         content = message.clean_content
-        
+
         # Handle empty content
         if not content.strip():
             content = "*[No text content]*"
-        
+
         # Handle long content
         if len(content) > 2000:
             content = content[:1997] + "..."
-        
+
         return content
 
+    def summarise(self, message, position):
+        """Keep only what the embed shows, not the Message object"""
+        return {
+            "id": message.id,
+            "position": position,
+            "created_at": message.created_at,
+            "content": self.format_content(message),
+            "attachments": [(a.filename, a.url) for a in message.attachments[:5]],
+            "attachment_count": len(message.attachments)
+        }
+
+    def is_own(self, message):
+        return message.author.id == self.channel.me.id
+
+    async def start(self):
+        """Load the first page, returns False when the bot has no messages here"""
+        await self.go_to(0)
+        return bool(self.window)
+
+    async def fetch_older(self):
+        """Append the bot's next messages older than the window, returns False at the end"""
+        found = 0
+        while not self.exhausted:
+            cursor_id, position = self.scan_cursor or (None, -1)
+            batch = min(DM_FETCH_SIZE, self.limit - position - 1)
+            if batch <= 0:
+                self.exhausted = True
+                break
+            before = discord.Object(id=cursor_id) if cursor_id else None
+            scanned = 0
+            async for message in self.channel.history(limit=batch, before=before):
+                scanned += 1
+                position += 1
+                self.scan_cursor = (message.id, position)
+                if self.is_own(message):
+                    self.window.append(self.summarise(message, position))
+                    found += 1
+            if scanned < batch or position + 1 >= self.limit:
+                self.exhausted = True
+            if found:
+                break
+        if self.exhausted:
+            self.total = self.window_start + len(self.window)
+        return bool(found)
+
+    async def fetch_newer(self, needed):
+        """Prepend up to `needed` of the bot's messages just newer than the window"""
+        newest = self.window[0]
+        cursor_id, position = newest["id"], newest["position"]
+        newer = []
+        while len(newer) < needed and position > 0:
+            scanned = 0
+            async for message in self.channel.history(
+                limit=min(DM_FETCH_SIZE, position), after=discord.Object(id=cursor_id), oldest_first=True
+            ):
+                scanned += 1
+                position -= 1
+                cursor_id = message.id
+                if self.is_own(message):
+                    newer.append(self.summarise(message, position))
+                    if len(newer) == needed:
+                        break
+            if not scanned:
+                break
+        newer.reverse()
+        self.window[:0] = newer
+        self.window_start -= len(newer)
+
+    def trim(self):
+        """Drop summaries far from the current message so the window stays small"""
+        excess = len(self.window) - DM_WINDOW
+        if excess <= 0:
+            return
+        front = min(excess, max(self.current_index - self.window_start - DM_WINDOW // 2, 0))
+        if front:
+            del self.window[:front]
+            self.window_start += front
+            excess -= front
+        if excess > 0:
+            del self.window[-excess:]
+            oldest = self.window[-1]
+            self.scan_cursor = (oldest["id"], oldest["position"])
+            self.exhausted = False
+
+    async def go_to(self, index):
+        """Move to the bot's message at `index`, fetching history as needed"""
+        index = max(index, 0)
+        if index < self.window_start:
+            if index == 0 or self.window_start - index > DM_WINDOW:
+                self.window, self.window_start = [], 0
+                self.scan_cursor, self.exhausted = None, False
+            else:
+                await self.fetch_newer(self.window_start - index)
+                index = max(index, self.window_start)
+        while index >= self.window_start + len(self.window):
+            if not await self.fetch_older():
+                break
+            # Keep the window bounded while scanning far ahead (e.g. ">>")
+            self.current_index = min(index, self.window_start + len(self.window) - 1)
+            self.trim()
+        self.current_index = min(index, self.window_start + len(self.window) - 1)
+        self.trim()
+        self.update_buttons()
+
+    def at_end(self):
+        return self.exhausted and self.current_index >= self.window_start + len(self.window) - 1
+
+    def update_buttons(self):
+        self.first_button.disabled = (self.current_index == 0)
+        self.prev_button.disabled = (self.current_index == 0)
+        self.next_button.disabled = self.at_end()
+        self.last_button.disabled = self.at_end()
+
     def create_embed(self):
-        msg = self.messages[self.current_index]
-        
+        msg = self.window[self.current_index - self.window_start]
+
         embed = discord.Embed(
             title=f"Message to {self.user.display_name}",
-            description=self.format_content(msg),
+            description=msg["content"],
             color=BLUE,
-            timestamp=msg.created_at
+            timestamp=msg["created_at"]
         )
-        
+
         # Add metadata fields
-        embed.add_field(name="Sent at", value=f"<t:{int(msg.created_at.timestamp())}:F>", inline=False)
-        
+        embed.add_field(name="Sent at", value=f"<t:{int(msg['created_at'].timestamp())}:F>", inline=False)
+
         # Handle attachments
-        if msg.attachments:
+        if msg["attachments"]:
             attachments = "\n".join(
-                [f"[{a.filename}]({a.url})" for a in msg.attachments[:5]]
+                [f"[{filename}]({url})" for filename, url in msg["attachments"]]
             )
-            if len(msg.attachments) > 5:
-                attachments += f"\n+{len(msg.attachments)-5} more..."
+            if msg["attachment_count"] > 5:
+                attachments += f"\n+{msg['attachment_count']-5} more..."
             embed.add_field(name="Attachments", value=attachments, inline=False)
-        
-        # Add message counter
-        embed.set_footer(text=f"Message {self.current_index+1}/{self.total} | ID: {msg.id}")
-        
+
+        # Add message counter, the total is only known once history runs out
+        total = self.total if self.total is not None else "?"
+        embed.set_footer(text=f"Message {self.current_index+1}/{total} | ID: {msg['id']}")
+
         return embed
 
+    async def show(self, interaction, index):
+        await interaction.response.defer()
+        async with self.lock:
+            await self.go_to(index)
+            embed = self.create_embed()
+        await interaction.edit_original_response(embed=embed, view=self)
+
     @discord.ui.button(label="<<", style=discord.ButtonStyle.secondary)
     async def first_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.current_index = 0
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+        await self.show(interaction, 0)
 
     @discord.ui.button(label="<", style=discord.ButtonStyle.primary)
     async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.current_index -= 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+        await self.show(interaction, self.current_index - 1)
 
     @discord.ui.button(label=">", style=discord.ButtonStyle.primary)
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.current_index += 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+        await self.show(interaction, self.current_index + 1)
 
     @discord.ui.button(label=">>", style=discord.ButtonStyle.secondary)
     async def last_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.current_index = self.total - 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+        await self.show(interaction, self.limit)
 
     @discord.ui.button(label="Exit", style=discord.ButtonStyle.danger)
     async def exit_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -303,7 +524,7 @@ async def custom_help(ctx):
             command_categories["General"].append(cmd)
         elif cmd.name in ['add', 'remove']:
             command_categories["Channel Management"].append(cmd)
-        elif cmd.name in ['nuke', 'clone', 'rename', 'delete', 'purge']:
+        elif cmd.name in ['nuke', 'clone', 'restore', 'rename', 'delete', 'purge']:
             command_categories["Admin"].append(cmd)
         elif cmd.name == 'remind':
             command_categories["Reminders"].append(cmd)
@@ -359,7 +580,6 @@ async def custom_help(ctx):
     )
     
     embed.set_footer(text="Made with 💙 by Happy Box")
-    await log_command_usage(ctx)
     await ctx.send(embed=embed)
 
 @bot.command(name='info')
@@ -382,6 +602,7 @@ async def custom_info(ctx):
             "=txid - Checks LTC transaction\n"
             "=nuke - Nukes a specific channel\n"
             "=clone - Clones a channel with same permissions\n"
+            "=restore - Restores a nuked channel from its snapshot\n"
             "=add - Adds a user to the channel\n"
             "=remove - Remove a user from a channel with\n"                
             "=rename - Renames a channel\n"
@@ -396,7 +617,6 @@ async def custom_info(ctx):
         color=BLUE
     )
     embed.set_footer(text="Made with 💙 by Happy Box")
-    await log_command_usage(ctx)
     await ctx.send(embed=embed)
 
 @bot.command(name='ping')
@@ -407,7 +627,6 @@ async def ping(ctx):
         description=f"🏓 Pong! Latency: {latency}ms",
         color=BLUE
     )
-    await log_command_usage(ctx)
     await ctx.send(embed=embed)
 
 # ----------------------
@@ -462,7 +681,6 @@ async def userinfo(interaction: discord.Interaction, member: discord.Member = No
 
         embed.set_footer(text=f"Requested by {interaction.user.name}")
 
-        await log_command_usage(interaction)
         await interaction.response.send_message(embed=embed)
     except Exception as e:
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
@@ -481,7 +699,6 @@ async def userinfo(interaction: discord.Interaction, member: discord.Member = No
 )
 async def say_command(interaction: discord.Interaction, msg: str, channel: discord.TextChannel = None, attachment: discord.Attachment = None):
     try:
-        await log_command_usage(interaction)
         await interaction.response.defer()
         target_channel = channel if channel else interaction.channel  
 
@@ -502,7 +719,6 @@ async def client_command(interaction: discord.Interaction, user: discord.Member)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
             
-        await log_command_usage(interaction)
         role = interaction.guild.get_role(client_role)
         if not role:
             embed = discord.Embed(description="# __Error__\nClient role not found.", color=BLUE)
@@ -537,7 +753,6 @@ async def client_command(interaction: discord.Interaction, user: discord.Member)
 )
 async def vouch_command(interaction: discord.Interaction, user: discord.Member, product_amt: int, product: str, for_text: str):
     try:
-        await log_command_usage(interaction)
         embed = discord.Embed(
             description=f"# __Vouch__\n```+rep {user.id} got {product_amt}x {product} for {for_text}, Legit!!```",
             color=BLUE
@@ -554,7 +769,6 @@ async def vouch_command(interaction: discord.Interaction, user: discord.Member,
 )
 async def role_command(interaction: discord.Interaction, user: discord.Member, role: discord.Role):
     try:
-        await log_command_usage(interaction)
         if not interaction.user.guild_permissions.manage_roles:
             embed = discord.Embed(description="You do not have permission to manage roles.", color=BLUE)
             await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -578,20 +792,74 @@ async def role_command(interaction: discord.Interaction, user: discord.Member, r
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
 
-@bot.tree.command(name="purge", description="Delete a specific number of messages from the channel.")
+@bot.tree.command(name="purge", description="Delete messages from the channel, optionally filtered.")
 @admin_only()
-@app_commands.describe(amt="The number of messages to delete.")
-async def purge_command(interaction: discord.Interaction, amt: int):
+@app_commands.describe(
+    amt="The number of recent messages to check.",
+    user="Only delete messages from this user.",
+    contains="Only delete messages containing this text.",
+    bots_only="Only delete messages sent by bots.",
+    before="Only delete messages sent before this date (YYYY-MM-DD).",
+    after="Only delete messages sent after this date (YYYY-MM-DD)."
+)
+async def purge_command(
+    interaction: discord.Interaction,
+    amt: int,
+    user: discord.User = None,
+    contains: str = None,
+    bots_only: bool = False,
+    before: str = None,
+    after: str = None
+):
     try:
-        await log_command_usage(interaction)
         if amt <= 0:
             embed = discord.Embed(description="Please specify a valid number of messages to delete.", color=BLUE)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
+        try:
+            before_date = datetime.strptime(before, "%Y-%m-%d").replace(tzinfo=timezone.utc) if before else None
+            after_date = datetime.strptime(after, "%Y-%m-%d").replace(tzinfo=timezone.utc) + timedelta(days=1) if after else None
+        except ValueError:
+            embed = discord.Embed(description="Dates must be in YYYY-MM-DD format.", color=BLUE)
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
         await interaction.response.defer(ephemeral=True)
-        deleted = await interaction.channel.purge(limit=amt)
-        embed = discord.Embed(description=f"Successfully Deleted {len(deleted)} messages.", color=BLUE)
-        await interaction.followup.send(embed=embed, ephemeral=True)
+
+        def matches(message):
+            if user and message.author.id != user.id:
+                return False
+            if bots_only and not message.author.bot:
+                return False
+            if contains and contains.lower() not in message.content.lower():
+                return False
+            return True
+
+        async def targets():
+            channel = interaction.channel
+            async for message in channel.history(limit=amt, before=before_date, after=after_date, oldest_first=False):
+                if matches(message):
+                    yield message
+
+        progress_message = await interaction.followup.send(
+            embed=discord.Embed(description="Deleting messages...", color=BLUE),
+            ephemeral=True,
+            wait=True
+        )
+
+        async def report_progress(stats):
+            embed = discord.Embed(description=f"Deleting messages... {stats.deleted}/{stats.found} deleted", color=BLUE)
+            await progress_message.edit(embed=embed)
+
+        stats = await purge_messages(
+            interaction.channel,
+            targets(),
+            workers=config.get("delete_workers", 3),
+            on_progress=report_progress
+        )
+        description = f"Successfully Deleted {stats.deleted} messages."
+        if stats.failed:
+            description += f" {stats.failed} could not be deleted."
+        await progress_message.edit(embed=discord.Embed(description=description, color=BLUE))
     except Exception as e:
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
         await interaction.followup.send(embed=error_embed, ephemeral=True)
@@ -600,7 +868,6 @@ async def purge_command(interaction: discord.Interaction, amt: int):
 @app_commands.checks.has_permissions(mute_members=True)
 async def qr_command(interaction: discord.Interaction):
     try:
-        await log_command_usage(interaction)
         embed = discord.Embed(
             title="**<:hb_UPI:1333397769343209483> KINDLY PAY ON THE GIVEN QR**",
             description=f"UPI ID: {upi_id}",
@@ -622,7 +889,6 @@ async def qr_command(interaction: discord.Interaction):
 )
 async def dm_command(interaction: discord.Interaction, user: discord.Member, message: str, attachment: discord.Attachment = None):
     try:
-        await log_command_usage(interaction)
         await interaction.response.defer()
         if attachment:
             await user.send(message, file=await attachment.to_file())
@@ -634,10 +900,154 @@ async def dm_command(interaction: discord.Interaction, user: discord.Member, mes
         embed = discord.Embed(description=f"Failed to send message to {user.mention}: {str(e)}", color=BLUE)
         await interaction.followup.send(embed=embed, ephemeral=True)
 
-@bot.command(name='txid')
-async def ltc_tx(ctx, tx_id: str):
-    from datetime import datetime, timezone, timedelta
+def add_receiver_fields(embed, receivers, price_data):
+    """Add receiver output fields, split across fields and summarised past the embed limits"""
+    if not receivers:
+        embed.add_field(name='Receiver Outputs:', value='No receiver outputs found', inline=False)
+        return
+
+    ltc_to_usd = price_data['usd']
+    ltc_to_inr = price_data['inr']
+    ltc_to_eur = price_data['eur']
+
+    # Only outputs with an address are listed, the first address of each
+    listed = [(output['addresses'][0], output['value'] / 1e8) for output in receivers if output['addresses']]
+    lines = [
+        f"- **Receiver Address:** {address}\n"
+        f"  - **Value Received:** {value:.8f} LTC ≈ ${value * ltc_to_usd:.2f} USD / ₹{value * ltc_to_inr:.2f} INR / €{value * ltc_to_eur:.2f} EUR\n\n"
+        for address, value in listed
+    ]
+
+    # Pack lines into fields of up to 1024 characters within the overall budget
+    fields = [""]
+    used = 0
+    shown = 0
+    for line in lines:
+        if used + len(line) > RECEIVER_CHAR_BUDGET:
+            break
+        if len(fields[-1]) + len(line) > EMBED_FIELD_LIMIT:
+            fields.append("")
+        fields[-1] += line
+        used += len(line)
+        shown += 1
+
+    for index, value in enumerate(fields):
+        name = f'Receiver Outputs: [{len(receivers)}]' if index == 0 else 'Receiver Outputs (cont.):'
+        embed.add_field(name=name, value=value or 'No receiver addresses found', inline=False)
+
+    if shown < len(listed):
+        hidden_ltc = sum(value for _, value in listed[shown:])
+        embed.add_field(
+            name='More Outputs:',
+            value=f"...and {len(listed) - shown} more outputs totalling {hidden_ltc:.8f} LTC ≈ ${hidden_ltc * ltc_to_usd:.2f} USD",
+            inline=False
+        )
+
+def build_tx_embed(data, price_data, prices_stale=False, watching=False):
+    """Build the =txid embed from parsed transaction data and LTC prices"""
+    embed = discord.Embed(title='LTC Transaction Details', color=BLUE)
+    
+    # Calculate receiver amount (excluding change) in one pass over the outputs
+    receivers = receiver_outputs(data)
+    receiver_amount = sum(output['value'] for output in receivers)
+    receiver_amount_ltc = receiver_amount / 1e8
+    
+    # Confirmation status (moved to top)
+    confirmations = data.get('confirmations', 0)
+    
+    # Format confirmation count display
+    if confirmations >= 6:
+        count_display = f"6+ | {confirmations}"
+    else:
+        count_display = f"{confirmations}/6"
+    
+    # Determine status and emoji
+    if confirmations >= 6:
+        status_emoji = "<a:hb_greentick:1356310199207723028>"
+        status_text = "**Confirmed**"
+    else:
+        status_emoji = "<a:red_redtick:1356310209638699149>"
+        status_text = "**Pending**"
+
+    # Create confirmation status string
+    confirmation_status = f"{status_emoji} {status_text} ( **{count_display}** )"
+    embed.add_field(name='Confirmation Status:', value=confirmation_status, inline=False)
+    
+    # Receiver Amount
+    embed.add_field(name='Receiver Amount:', value=f"{receiver_amount_ltc:.8f} LTC", inline=False)
+    
+    # Get and format transaction time in IST
+    tx_time_str = data.get('time')
+
+    if tx_time_str:
+        try:
+            # Handle both formats: with and without milliseconds
+            if '.' in tx_time_str:
+                tx_time_utc = datetime.strptime(tx_time_str, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
+            else:
+                tx_time_utc = datetime.strptime(tx_time_str, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+            
+            # Convert to IST (UTC+5:30)
+            ist_tz = timezone(timedelta(hours=5, minutes=30))
+            tx_time_ist = tx_time_utc.astimezone(ist_tz)
+            
+            # Format IST time
+            ist_time_str = tx_time_ist.strftime('%Y-%m-%d %H:%M:%S IST')
+            
+            # Format UTC time for Discord
+            unix_timestamp = int(tx_time_utc.timestamp())
+            discord_timestamp = f"<t:{unix_timestamp}:F> (<t:{unix_timestamp}:R>)"
+            
+            # Combine both time formats
+            time_value = f"{discord_timestamp}"
+            
+        except ValueError:
+            time_value = 'N/A'
+    else:
+        time_value = 'N/A'
+
+    embed.add_field(name='Transaction Time:', value=time_value, inline=False)
     
+    # Show only receiver outputs with USD, INR, and EURO values
+    add_receiver_fields(embed, receivers, price_data)
+
+    # The API may return fewer outputs than the transaction has
+    missing_outputs = data.get('output_count', len(data['outputs'])) - len(data['outputs'])
+    if missing_outputs > 0:
+        embed.add_field(
+            name='Incomplete Outputs:',
+            value=f"⚠️ {missing_outputs} of {data['output_count']} outputs weren't returned by the API, the receiver amount may be incomplete",
+            inline=False
+        )
+
+    footer_notes = []
+    if prices_stale:
+        footer_notes.append("⚠️ Exchange rates may be out of date - the price API is slow or unavailable")
+    if watching:
+        footer_notes.append("👀 Watching for confirmation updates")
+    if footer_notes:
+        embed.set_footer(text=" | ".join(footer_notes))
+    return embed
+
+async def update_watched_tx(data, messages, watching=True):
+    """Edit every watched =txid embed after the confirmation count changes or the watch ends"""
+    try:
+        price_data, prices_stale = await bot.price_cache.get()
+    except Exception as e:
+        print(f"Failed to fetch exchange rates for tx update: {e}")
+        return
+
+    watching = watching and data.get('confirmations', 0) < CONFIRMATIONS_REQUIRED
+    embed = build_tx_embed(data, price_data, prices_stale, watching=watching)
+    for message in messages:
+        try:
+            await message.edit(embed=embed)
+        except discord.HTTPException as e:
+            print(f"Failed to update tx embed: {e}")
+
+@bot.command(name='txid')
+async def ltc_tx(ctx, tx_id: str, watch_hash: str = None):
+    """Check an LTC transaction (=txid watch <hash> keeps it updated)"""
     # Permission check
     allowed_roles = ["≜ Happy Box Staff", "Administrator"]
     if not any(role.name in allowed_roles for role in ctx.author.roles):
@@ -649,144 +1059,36 @@ async def ltc_tx(ctx, tx_id: str):
         return
 
     try:
-        await log_command_usage(ctx)
-        
+        watch = tx_id.lower() == "watch"
+        if watch:
+            tx_id = watch_hash
+
         if not tx_id:
             embed = discord.Embed(description="Please provide a transaction ID", color=BLUE)
             await ctx.send(embed=embed)
             return
 
-        url = f'https://api.blockcypher.com/v1/ltc/main/txs/{tx_id}'
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            embed = discord.Embed(description=f'Error fetching transaction details: {e}', color=BLUE)
+        # Fetch the transaction and exchange rates concurrently
+        data, price_data = await asyncio.gather(
+            get_transaction(bot.tx_provider, bot.tx_cache, tx_id),
+            bot.price_cache.get(),
+            return_exceptions=True
+        )
+        if isinstance(data, Exception):
+            embed = discord.Embed(description=f'Error fetching transaction details: {data}', color=BLUE)
             await ctx.send(embed=embed)
             return
-
-        data = response.json()
-        try:
-            # Get multiple currency rates
-            price_response = requests.get('https://api.coingecko.com/api/v3/simple/price?ids=litecoin&vs_currencies=usd,inr,eur', timeout=10)
-            price_response.raise_for_status()
-            price_data = price_response.json()
-            ltc_to_usd = price_data['litecoin']['usd']
-            ltc_to_inr = price_data['litecoin']['inr']
-            ltc_to_eur = price_data['litecoin']['eur']
-        except requests.exceptions.RequestException as e:
-            embed = discord.Embed(description=f'Error fetching exchange rates: {e}', color=BLUE)
+        if isinstance(price_data, Exception):
+            embed = discord.Embed(description=f'Error fetching exchange rates: {price_data}', color=BLUE)
             await ctx.send(embed=embed)
             return
 
-        embed = discord.Embed(title='LTC Transaction Details', color=BLUE)
-        
-        # Calculate receiver amount (excluding change)
-        outputs = data.get('outputs', [])
-        inputs = data.get('inputs', [])
-        
-        input_addresses = set()
-        for tx_input in inputs:
-            input_addresses.update(tx_input.get('addresses', []))
-        
-        receiver_amount = 0
-        receiver_outputs = []
-        for output in outputs:
-            addresses = output.get('addresses', [])
-            if not any(addr in input_addresses for addr in addresses):
-                receiver_amount += output.get('value', 0)
-                receiver_outputs.append(output)
-        
-        receiver_amount_ltc = receiver_amount / 1e8
-        
-        # Confirmation status (moved to top)
-        confirmations = data.get('confirmations', 0)
-        
-        # Format confirmation count display
-        if confirmations >= 6:
-            count_display = f"6+ | {confirmations}"
-        else:
-            count_display = f"{confirmations}/6"
-        
-        # Determine status and emoji
-        if confirmations >= 6:
-            status_emoji = "<a:hb_greentick:1356310199207723028>"
-            status_text = "**Confirmed**"
-        else:
-            status_emoji = "<a:red_redtick:1356310209638699149>"
-            status_text = "**Pending**"
-
-        # Create confirmation status string
-        confirmation_status = f"{status_emoji} {status_text} ( **{count_display}** )"
-        embed.add_field(name='Confirmation Status:', value=confirmation_status, inline=False)
-        
-        # Receiver Amount
-        embed.add_field(name='Receiver Amount:', value=f"{receiver_amount_ltc:.8f} LTC", inline=False)
-        
-        # Get and format transaction time in IST
-        if data.get('confirmed'):
-            tx_time_str = data['confirmed']
-        elif data.get('received'):
-            tx_time_str = data['received']
-        else:
-            tx_time_str = None
-
-        if tx_time_str:
-            try:
-                # Handle both formats: with and without milliseconds
-                if '.' in tx_time_str:
-                    tx_time_utc = datetime.strptime(tx_time_str, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
-                else:
-                    tx_time_utc = datetime.strptime(tx_time_str, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
-                
-                # Convert to IST (UTC+5:30)
-                ist_tz = timezone(timedelta(hours=5, minutes=30))
-                tx_time_ist = tx_time_utc.astimezone(ist_tz)
-                
-                # Format IST time
-                ist_time_str = tx_time_ist.strftime('%Y-%m-%d %H:%M:%S IST')
-                
-                # Format UTC time for Discord
-                unix_timestamp = int(tx_time_utc.timestamp())
-                discord_timestamp = f"<t:{unix_timestamp}:F> (<t:{unix_timestamp}:R>)"
-                
-                # Combine both time formats
-                time_value = f"{discord_timestamp}"
-                
-            except ValueError:
-                time_value = 'N/A'
-        else:
-            time_value = 'N/A'
-
-        embed.add_field(name='Transaction Time:', value=time_value, inline=False)
-        
-        # Show only receiver outputs with USD, INR, and EURO values
-        output_details = []
-        for output in receiver_outputs:
-            addresses = output.get("addresses", [])
-            value = output.get("value", 0) / 1e8
-            value_usd = value * ltc_to_usd
-            value_inr = value * ltc_to_inr
-            value_eur = value * ltc_to_eur
-            
-            # Only show the first address for each output
-            if addresses:
-                address = addresses[0]
-                output_details.append(
-                    f"- **Receiver Address:** {address}\n"
-                    f"  - **Value Received:** {value:.8f} LTC ≈ ${value_usd:.2f} USD / ₹{value_inr:.2f} INR / €{value_eur:.2f} EUR\n"
-                )
-        
-        if output_details:
-            embed.add_field(name=f'Receiver Outputs: [{len(receiver_outputs)}]', 
-                          value='\n'.join(output_details), 
-                          inline=False)
-        else:
-            embed.add_field(name='Receiver Outputs:', 
-                          value='No receiver outputs found', 
-                          inline=False)
-
-        await ctx.send(embed=embed)
+        price_data, prices_stale = price_data
+        watching = watch and data.get('confirmations', 0) < CONFIRMATIONS_REQUIRED
+        embed = build_tx_embed(data, price_data, prices_stale, watching=watching)
+        message = await ctx.send(embed=embed)
+        if watching:
+            bot.tx_watcher.watch(data, message)
     except Exception as e:
         embed = discord.Embed(description=f"An error occurred: {e}", color=BLUE)
         await ctx.send(embed=embed)
@@ -801,7 +1103,6 @@ async def play(interaction: discord.Interaction, game: str):
     try:
         await bot.change_presence(activity=discord.Game(name=game))
         embed = discord.Embed(description=f"Now Playing: {game}", color=BLUE)
-        await log_command_usage(interaction)
         await interaction.response.send_message(embed=embed, ephemeral=True)
     except Exception as e:
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
@@ -814,7 +1115,6 @@ async def stream(interaction: discord.Interaction, title: str):
         activity = discord.Streaming(name=title, url="https://www.twitch.tv/wallibear")
         await bot.change_presence(activity=activity)
         embed = discord.Embed(description=f"Now Streaming: {title}", color=BLUE)
-        await log_command_usage(interaction)
         await interaction.response.send_message(embed=embed, ephemeral=True)
     except Exception as e:
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
@@ -827,7 +1127,6 @@ async def listen(interaction: discord.Interaction, title: str):
         activity = discord.Activity(type=discord.ActivityType.listening, name=title)
         await bot.change_presence(activity=activity)
         embed = discord.Embed(description=f"Now Listening to: {title}", color=BLUE)
-        await log_command_usage(interaction)
         await interaction.response.send_message(embed=embed, ephemeral=True)
     except Exception as e:
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
@@ -840,7 +1139,6 @@ async def watch(interaction: discord.Interaction, title: str):
         activity = discord.Activity(type=discord.ActivityType.watching, name=title)
         await bot.change_presence(activity=activity)
         embed = discord.Embed(description=f"Now Watching: {title}", color=BLUE)
-        await log_command_usage(interaction)
         await interaction.response.send_message(embed=embed, ephemeral=True)
     except Exception as e:
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
@@ -852,7 +1150,6 @@ async def clear_status(interaction: discord.Interaction):
     try:
         await bot.change_presence(activity=None)
         embed = discord.Embed(description="Bot activity has been cleared!", color=BLUE)
-        await log_command_usage(interaction)
         await interaction.response.send_message(embed=embed, ephemeral=True)
     except Exception as e:
         error_embed = discord.Embed(title="Error", description=f"An error occurred: {e}", color=BLUE)
@@ -867,12 +1164,10 @@ async def clear_status(interaction: discord.Interaction):
 async def nuke_command(ctx):
     """Nuke the current channel: deletes and recreates the channel."""
     try:
-        await log_command_usage(ctx)
-        
         # Create the confirmation embed (BLUE color)
         confirm_embed = discord.Embed(
             title="<a:hb_alert:1356310188004606072> Nuke Confirmation",
-            description=f"Are you sure you want to nuke {ctx.channel.mention}?\nThis action cannot be undone!",
+            description=f"Are you sure you want to nuke {ctx.channel.mention}?\nAll messages will be deleted!",
             color=BLUE
         )
         confirm_embed.set_footer(text="You have 10 seconds to decide")
@@ -916,31 +1211,21 @@ async def nuke_command(ctx):
         if not view.value:
             return
 
-        # Backup channel details
+        # Snapshot the full channel state to disk before deleting anything
         channel = ctx.channel
-        guild = ctx.guild
-        channel_name = channel.name
-        channel_category = channel.category
-        channel_position = channel.position
-        overwrites = channel.overwrites
+        snapshot = await capture_channel(channel)
+        snapshot_id = await run_io(bot.snapshots.save, snapshot)
 
-        # Delete original channel
+        # Delete original channel and recreate it from the snapshot
         await channel.delete(reason=f"Nuked by {ctx.author}")
-
-        # Recreate channel
-        new_channel = await guild.create_text_channel(
-            name=channel_name,
-            category=channel_category,
-            position=channel_position,
-            overwrites=overwrites,
-            reason=f"Nuked by {ctx.author}"
-        )
+        new_channel = await restore_channel(ctx.guild, snapshot, reason=f"Nuked by {ctx.author}")
 
         # Send confirmation embed in new channel
         nuke_embed = discord.Embed(
             description=f"**Nuked By** `{ctx.author.name}`",
             color=BLUE
         )
+        nuke_embed.set_footer(text=f"Snapshot: {snapshot_id}")
         await new_channel.send(embed=nuke_embed)
 
     except Exception as e:
@@ -952,11 +1237,11 @@ async def nuke_command(ctx):
 async def clone_channel(ctx):
     """Clone the current channel with same permissions"""
     try:
-        await log_command_usage(ctx)
         original_channel = ctx.channel
         
-        # Create new channel with same properties
-        new_channel = await original_channel.clone(reason=f"Channel cloned by {ctx.author}")
+        # Create new channel with the same configuration, pins and webhooks
+        snapshot = await capture_channel(original_channel)
+        new_channel = await restore_channel(ctx.guild, snapshot, reason=f"Channel cloned by {ctx.author}")
         
         # Send confirmation in original channel
         embed = discord.Embed(
@@ -979,12 +1264,51 @@ async def clone_channel(ctx):
         )
         await ctx.send(embed=embed)
 
+@bot.command(name='restore')
+@commands.has_permissions(administrator=True)
+async def restore_snapshot(ctx, snapshot_id: str = None):
+    """Restore a channel from a snapshot, or list recent snapshots"""
+    try:
+        if not snapshot_id:
+            snapshot_ids = await run_io(bot.snapshots.list, ctx.guild.id)
+            lines = []
+            for listed_id in snapshot_ids[:10]:
+                channel_id, captured_at = listed_id.rsplit("-", 1)
+                lines.append(f"`{listed_id}` - <#{channel_id}> <t:{captured_at}:R>")
+            embed = discord.Embed(
+                title="Channel Snapshots",
+                description="\n".join(lines) or "No snapshots saved yet.",
+                color=BLUE
+            )
+            embed.set_footer(text=f"Use {prefix}restore <snapshot> to restore one")
+            await ctx.send(embed=embed)
+            return
+
+        snapshot = await run_io(bot.snapshots.load, ctx.guild.id, snapshot_id)
+        if not snapshot:
+            embed = discord.Embed(description=f"No snapshot `{snapshot_id}` found.", color=BLUE)
+            await ctx.send(embed=embed)
+            return
+
+        new_channel = await restore_channel(ctx.guild, snapshot, reason=f"Restored by {ctx.author}")
+        embed = discord.Embed(
+            description=f"Restored `#{snapshot['name']}` as {new_channel.mention}",
+            color=BLUE
+        )
+        await ctx.send(embed=embed)
+
+    except Exception as e:
+        embed = discord.Embed(
+            description=f"Error restoring channel: {str(e)}",
+            color=BLUE
+        )
+        await ctx.send(embed=embed)
+
 @bot.command(name='rename')
 @commands.has_permissions(manage_channels=True)
 async def rename_channel(ctx, *, new_name: str):
     """Rename the current channel"""
     try:
-        await log_command_usage(ctx)
         original_name = ctx.channel.name
         await ctx.channel.edit(name=new_name)
         
@@ -1006,7 +1330,6 @@ async def rename_channel(ctx, *, new_name: str):
 async def delete_channel(ctx):
     """Delete the current channel with confirmation"""
     try:
-        await log_command_usage(ctx)
         # Create the confirmation embed
         confirm_embed = discord.Embed(
             title="<a:hb_alert:1356310188004606072> Delete Channel Confirmation",
@@ -1081,7 +1404,6 @@ async def delete_channel(ctx):
 )
 async def get_dms(interaction: discord.Interaction, user: discord.User, limit: int = 100):
     try:
-        await log_command_usage(interaction)
         await interaction.response.defer(ephemeral=True)
         
         # Check DM access
@@ -1095,12 +1417,10 @@ async def get_dms(interaction: discord.Interaction, user: discord.User, limit: i
             await interaction.followup.send(embed=embed)
             return
         
-        # Get messages
+        # Load the first page only, the rest is fetched as the user navigates
+        paginator = DMPaginator(channel, user, limit)
         try:
-            messages = []
-            async for message in channel.history(limit=limit):
-                if message.author == bot.user:
-                    messages.append(message)
+            found = await paginator.start()
         except discord.Forbidden:
             embed = discord.Embed(
                 description=f"<a:hb_redtick:1356310209638699149> No permission to read message history in {user.mention}'s DMs.",
@@ -1109,7 +1429,7 @@ async def get_dms(interaction: discord.Interaction, user: discord.User, limit: i
             await interaction.followup.send(embed=embed)
             return
         
-        if not messages:
+        if not found:
             embed = discord.Embed(
                 description=f"<a:hb_blue_alert:1378437322756067478> No messages from the bot found in {user.mention}'s DMs.",
                 color=BLUE
@@ -1117,8 +1437,6 @@ async def get_dms(interaction: discord.Interaction, user: discord.User, limit: i
             await interaction.followup.send(embed=embed)
             return
         
-        # Create and send paginator
-        paginator = DMPaginator(messages, user)
         paginator.message = await interaction.followup.send(
             embed=paginator.create_embed(),
             view=paginator,
@@ -1141,7 +1459,6 @@ async def get_dms(interaction: discord.Interaction, user: discord.User, limit: i
 )
 async def clear_dms(interaction: discord.Interaction, user: discord.User, limit: int = 100):
     try:
-        await log_command_usage(interaction)
         await interaction.response.defer(ephemeral=True)
         
         # Check if we have DM channel with this user
@@ -1155,48 +1472,47 @@ async def clear_dms(interaction: discord.Interaction, user: discord.User, limit:
             await interaction.followup.send(embed=embed)
             return
         
-        # Get messages
-        try:
-            messages = []
+        # Stream the bot's messages from history straight into the deletion workers
+        async def bot_messages():
             async for message in channel.history(limit=limit):
                 if message.author == bot.user:
-                    messages.append(message)
+                    yield message
+
+        progress_message = await interaction.followup.send(
+            embed=discord.Embed(description=f"Deleting bot messages in {user.mention}'s DMs...", color=BLUE),
+            wait=True
+        )
+
+        async def report_progress(stats):
+            embed = discord.Embed(
+                description=f"Deleting bot messages in {user.mention}'s DMs... {stats.deleted}/{stats.found} deleted",
+                color=BLUE
+            )
+            await progress_message.edit(embed=embed)
+
+        try:
+            stats = await delete_messages(bot_messages(), workers=config.get("delete_workers", 3), on_progress=report_progress)
         except discord.Forbidden:
             embed = discord.Embed(
                 description=f"No permission to read message history in {user.mention}'s DMs.",
                 color=BLUE
             )
-            await interaction.followup.send(embed=embed)
+            await progress_message.edit(embed=embed)
             return
         
-        if not messages:
+        if not stats.found:
             embed = discord.Embed(
                 description=f"No messages from the bot found in {user.mention}'s DMs.",
                 color=BLUE
             )
-            await interaction.followup.send(embed=embed)
+            await progress_message.edit(embed=embed)
             return
         
-        # Delete messages
-        deleted = 0
-        for message in messages:
-            try:
-                await message.delete()
-                deleted += 1
-                await asyncio.sleep(0.5)  # Rate limit prevention
-            except discord.NotFound:
-                continue
-            except discord.Forbidden:
-                continue
-            except Exception as e:
-                print(f"Error deleting message: {e}")
-                continue
-        
         embed = discord.Embed(
-            description=f"Deleted {deleted} messages in {user.mention}'s DMs.",
+            description=f"Deleted {stats.deleted} messages in {user.mention}'s DMs.",
             color=BLUE
         )
-        await interaction.followup.send(embed=embed)
+        await progress_message.edit(embed=embed)
         
     except Exception as e:
         error_embed = discord.Embed(
@@ -1209,9 +1525,31 @@ async def clear_dms(interaction: discord.Interaction, user: discord.User, limit:
 # ----------------------
 # BOT STARTUP
 # ----------------------
+mark_phase("commands")
+
+async def check_startup():
+    """Log in and connect once, then report how long each startup phase took"""
+    async with bot:
+        await bot.login(token)
+        mark_phase("login")
+        gateway = asyncio.create_task(bot.connect())
+        ready = asyncio.create_task(bot.wait_until_ready())
+        done, _ = await asyncio.wait({gateway, ready}, return_when=asyncio.FIRST_COMPLETED)
+        if gateway in done:
+            ready.cancel()
+            gateway.result()  # Surface the connection error
+        mark_phase("gateway ready")
+    for phase, seconds in startup_phases:
+        print(f"{phase:<15}{seconds * 1000:>10.1f} ms")
+    print(f"{'total':<15}{sum(seconds for _, seconds in startup_phases) * 1000:>10.1f} ms")
+    print(f"Skipped in --check mode: {', '.join(CHECK_SKIPPED)}")
+
 if __name__ == "__main__":
     try:
-        bot.run(token)
+        if CHECK_MODE:
+            asyncio.run(check_startup())
+        else:
+            bot.run(token)
     except discord.LoginError:
         print("Invalid bot token - please check your config.yaml")
     except Exception as e:
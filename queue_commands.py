@@ -3,23 +3,24 @@ from discord import app_commands
 from discord.app_commands import CheckFailure
 import yaml
 import json
+import math
 import os
+import re
+import sqlite3
+import time
+from datetime import datetime, timezone
+from fileio import run_io
 
 # Load configuration
 with open("config.yaml", "r") as file:
     config = yaml.safe_load(file)
 
 queue_channel_id = config.get("queue_channel", None)
-records_file = "records.json"
+records_file = "records.json"  # Legacy store, imported once into the orders database
+orders_db = config.get("orders_db", "orders.db")
+RECORDS_PAGE_SIZE = 10
 admin_role = config["admin_role"]
 BLUE = 0x0000FF
-bot_logs = config["bot_logs"]
-
-async def log_command_usage(interaction: discord.Interaction):
-    log_channel = interaction.guild.get_channel(bot_logs)
-    if log_channel:
-        embed = discord.Embed(description=f":User    {interaction.user.mention}, Command: /{interaction.command.name}", color=BLUE)
-        await log_channel.send(embed=embed)
 
 def admin_only():
     async def predicate(interaction: discord.Interaction):
@@ -31,36 +32,251 @@ def admin_only():
         return True
     return app_commands.check(predicate)
 
-def load_records():
-    if os.path.exists(records_file):
-        with open(records_file, "r") as file:
-            try:
-                data = json.load(file)
-                if isinstance(data, list): 
-                    return data
-            except json.JSONDecodeError:
-                print("⚠️ records.json is corrupted! Resetting file.")
-        return [] 
-    return []
-
-def save_records(records_list):
-    with open(records_file, "w") as file:
-        json.dump(records_list, file, indent=4)
+class OrderStore:
+    """SQLite-backed order records"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user TEXT NOT NULL,
+            user_id INTEGER,
+            product TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            mop TEXT NOT NULL,
+            additional_text TEXT NOT NULL,
+            handled_by TEXT NOT NULL,
+            handled_by_id INTEGER,
+            created_at INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_orders_user ON orders (user_id);
+        CREATE INDEX IF NOT EXISTS idx_orders_handled_by ON orders (handled_by_id);
+        CREATE INDEX IF NOT EXISTS idx_orders_product ON orders (product COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders (created_at);
+    """
+    COLUMNS = ("user", "user_id", "product", "quantity", "mop", "additional_text", "handled_by", "handled_by_id", "created_at")
+
+    def __init__(self, path):
+        # Only the I/O thread touches the connection once the bot is running
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def add(self, record):
+        """Insert an order and return its id"""
+        with self.conn:
+            cursor = self.conn.execute(
+                f"INSERT INTO orders ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                [record.get(column) for column in self.COLUMNS]
+            )
+        return cursor.lastrowid
+
+    @staticmethod
+    def _where(filters):
+        """Build a WHERE clause from /records filters"""
+        clauses, params = [], []
+        if filters.get("user_id"):
+            clauses.append("user_id = ?")
+            params.append(filters["user_id"])
+        if filters.get("handled_by_id"):
+            clauses.append("handled_by_id = ?")
+            params.append(filters["handled_by_id"])
+        if filters.get("product"):
+            clauses.append("product = ? COLLATE NOCASE")
+            params.append(filters["product"])
+        if filters.get("since") is not None:
+            clauses.append("created_at >= ?")
+            params.append(filters["since"])
+        if filters.get("until") is not None:
+            clauses.append("created_at < ?")
+            params.append(filters["until"])
+        return clauses, params
+
+    def count(self, filters):
+        clauses, params = self._where(filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.conn.execute(f"SELECT COUNT(*) FROM orders {where}", params).fetchone()[0]
+
+    def page(self, filters, before_id=None, after_id=None, oldest=False, limit=RECORDS_PAGE_SIZE):
+        """Return one page of orders, newest first, addressed by the id next to it"""
+        clauses, params = self._where(filters)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(after_id)
+        ascending = after_id is not None or oldest
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT * FROM orders {where} ORDER BY id {'ASC' if ascending else 'DESC'} LIMIT ?",
+            params + [limit]
+        )
+        records_list = [dict(row) for row in rows]
+        return records_list[::-1] if ascending else records_list
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM orders")
+
+    def import_json(self, path):
+        """One-time migration of the legacy records.json file"""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r") as file:
+                records_list = json.load(file)
+            if not isinstance(records_list, list):
+                records_list = []
+            for record in records_list:
+                record["user_id"] = mention_id(record.get("user"))
+                record["handled_by_id"] = mention_id(record.get("handled_by"))
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT INTO orders ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                    [[record.get(column) for column in self.COLUMNS] for record in records_list]
+                )
+            os.replace(path, f"{path}.migrated")
+            print(f"Migrated {len(records_list)} records from {path}")
+            return len(records_list)
+        except (json.JSONDecodeError, sqlite3.Error, KeyError) as e:
+            print(f"⚠️ Failed to migrate {path}: {e}")
+            return 0
+
+def mention_id(mention):
+    """Extract the user id from a <@id> mention string"""
+    match = re.fullmatch(r"<@!?(\d+)>", mention or "")
+    return int(match.group(1)) if match else None
+
+def shorten(text, length):
+    text = str(text)
+    return text if len(text) <= length else text[:length - 3] + "..."
+
+def parse_date(value):
+    """Parse a YYYY-MM-DD filter into a UTC timestamp"""
+    return int(datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp())
+
+order_store = OrderStore(orders_db)
+order_store.import_json(records_file)
+
+class RecordsPaginator(discord.ui.View):
+    """Pages through order records, holding only the visible page in memory"""
+
+    def __init__(self, filters, total, user):
+        super().__init__(timeout=300)
+        self.filters = filters
+        self.total = total
+        self.user = user
+        self.pages = max(1, math.ceil(total / RECORDS_PAGE_SIZE))
+        self.current_page = 0
+        self.records = []
+
+    async def load(self, page, **cursor):
+        self.records = await run_io(order_store.page, self.filters, **cursor)
+        if not self.records:
+            # Records were cleared or deleted while paging, start over from the newest
+            self.total = await run_io(order_store.count, self.filters)
+            self.pages = max(1, math.ceil(self.total / RECORDS_PAGE_SIZE))
+            page = 0
+            if self.total:
+                self.records = await run_io(order_store.page, self.filters)
+        self.current_page = page
+        self.update_buttons()
+
+    def update_buttons(self):
+        self.first_button.disabled = (self.current_page == 0)
+        self.prev_button.disabled = (self.current_page == 0)
+        self.next_button.disabled = (self.current_page >= self.pages - 1)
+        self.last_button.disabled = (self.current_page >= self.pages - 1)
+
+    def format_record(self, record):
+        created = f" <t:{record['created_at']}:d>" if record.get("created_at") else ""
+        return (
+            f"`#{record['id']}`{created} **{record['user']} | {shorten(record['product'], 100)} | {record['quantity']} | "
+            f"{shorten(record['mop'], 50)} - {shorten(record['additional_text'], 150)} - Handled by: {record['handled_by']}**"
+        )
+
+    def create_embed(self):
+        records_text = "\n".join(self.format_record(record) for record in self.records) or "No records found."
+        embed = discord.Embed(color=BLUE, description=f"# __Records__\n{records_text}")
+        embed.set_footer(text=f"Page {self.current_page+1}/{self.pages} | {self.total} records")
+        return embed
+
+    async def show(self, interaction: discord.Interaction):
+        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+
+    @discord.ui.button(label="<<", style=discord.ButtonStyle.secondary)
+    async def first_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.load(0)
+        await self.show(interaction)
+
+    @discord.ui.button(label="<", style=discord.ButtonStyle.primary)
+    async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.load(self.current_page - 1, after_id=self.records[0]['id'])
+        await self.show(interaction)
+
+    @discord.ui.button(label=">", style=discord.ButtonStyle.primary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.load(self.current_page + 1, before_id=self.records[-1]['id'])
+        await self.show(interaction)
+
+    @discord.ui.button(label=">>", style=discord.ButtonStyle.secondary)
+    async def last_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # The last page holds the remainder so page boundaries match paging forwards
+        remainder = self.total - (self.pages - 1) * RECORDS_PAGE_SIZE
+        await self.load(self.pages - 1, oldest=True, limit=remainder)
+        await self.show(interaction)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.user.id
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        try:
+            await self.message.edit(view=self)
+        except discord.NotFound:
+            pass
 
 def register_commands(bot):
-    @bot.tree.command(name="records", description="Lists all records in records.json")
+    @bot.tree.command(name="records", description="Lists order records, newest first")
     @admin_only()
-    async def show_records(interaction: discord.Interaction):
-        await log_command_usage(interaction)
-        records_list = load_records()
+    @app_commands.describe(
+        user="Only show orders for this customer.",
+        handled_by="Only show orders handled by this staff member.",
+        product="Only show orders for this product.",
+        since="Only show orders placed on or after this date (YYYY-MM-DD).",
+        until="Only show orders placed on or before this date (YYYY-MM-DD)."
+    )
+    async def show_records(
+        interaction: discord.Interaction,
+        user: discord.Member = None,
+        handled_by: discord.Member = None,
+        product: str = None,
+        since: str = None,
+        until: str = None
+    ):
+        try:
+            filters = {
+                "user_id": user.id if user else None,
+                "handled_by_id": handled_by.id if handled_by else None,
+                "product": product,
+                "since": parse_date(since) if since else None,
+                "until": parse_date(until) + 86400 if until else None
+            }
+        except ValueError:
+            await interaction.response.send_message("Dates must be in YYYY-MM-DD format.", ephemeral=True)
+            return
 
-        if not records_list:
-            await interaction.response.send_message("The records are currently empty.", ephemeral=True)
+        total = await run_io(order_store.count, filters)
+        if not total:
+            await interaction.response.send_message("No matching records found.", ephemeral=True)
             return
 
-        records_text = "\n".join([f"{record['user']} | {record['product']} | {record['quantity']} | {record['mop']} - {record['additional_text']} - Handled by: {record['handled_by']}" for record in records_list])
-        embed = discord.Embed(color=0x0000FF, description=f"# __Records__\n**{records_text}**")
-        await interaction.response.send_message(embed=embed)
+        paginator = RecordsPaginator(filters, total, interaction.user)
+        await paginator.load(0)
+        await interaction.response.send_message(embed=paginator.create_embed(), view=paginator)
+        paginator.message = await interaction.original_response()
 
     @bot.tree.command(name="queue-add", description="Adds a new entry to records")
     @admin_only()
@@ -75,8 +291,6 @@ def register_commands(bot):
         dm: bool = False,  # Optional parameter for DM
         channel: discord.TextChannel = None  # Optional parameter for channel mentions
     ):
-        await log_command_usage(interaction)
-        records_list = load_records()
 
         # Create the record entry
         record_entry = {
@@ -85,10 +299,12 @@ def register_commands(bot):
             "mop": mop,  # Store the payment method
             "quantity": quantity,
             "additional_text": additional_text,
-            "handled_by": handled_by.mention
+            "handled_by": handled_by.mention,
+            "user_id": user.id,
+            "handled_by_id": handled_by.id,
+            "created_at": int(time.time())
         }
-        records_list.append(record_entry)
-        save_records(records_list)
+        await run_io(order_store.add, record_entry)
 
         # Format the message as plain text
         message = (
@@ -113,9 +329,8 @@ def register_commands(bot):
         else:
             await interaction.response.send_message("⚠️ Queue channel not found!", ephemeral=True)
 
-    @bot.tree.command(name="clear-records", description="Clears all records from records.json")
+    @bot.tree.command(name="clear-records", description="Clears all order records")
     @admin_only()
     async def clear_records(interaction: discord.Interaction):
-        await log_command_usage(interaction)
-        save_records([])  # Clear the records by saving an empty list
+        await run_io(order_store.clear)
         await interaction.response.send_message("✅ All records have been cleared.", ephemeral=True)
@@ -3,69 +3,283 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import asyncio
+import heapq
+import itertools
 import time
 import math
+import os
 import re
+import sqlite3
+import yaml
+from fileio import run_io
 from datetime import datetime, timedelta
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml, much faster when available
+except ImportError:
+    from yaml import SafeLoader
+
 # ----------------------
 # CONSTANTS & CONFIG
 # ----------------------
 BLUE = 0x0000FF
-REMINDERS_FILE = "reminders.yaml"
-reminders_lock = asyncio.Lock()
+REMINDERS_FILE = "reminders.yaml"  # Legacy store, imported once into the database
+REMINDERS_DB = "reminders.db"
+DELIVERY_CONCURRENCY = 5  # Reminders sent at once when a batch comes due
+PAGE_SIZE = 25  # Discord's limit on select menu options
+CHECKPOINT_INTERVAL = 300  # Seconds between folding the write-ahead log into the database
+
+# ----------------------
+# REMINDER STORE
+# ----------------------
+class ReminderStore:
+    """SQLite-backed reminder storage"""
+    # The connection is shared with the I/O thread, so call it through run_io
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reminders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            end_time INTEGER NOT NULL,
+            message TEXT NOT NULL,
+            duration TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_reminders_user ON reminders (user_id, end_time);
+        CREATE INDEX IF NOT EXISTS idx_reminders_end_time ON reminders (end_time);
+    """
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA wal_autocheckpoint=0")  # Compaction runs from checkpoint() instead
+        self.conn.executescript(self.SCHEMA)
+
+    def add(self, reminder):
+        """Insert a reminder and store its new id on the dict"""
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO reminders (user_id, channel_id, end_time, message, duration) VALUES (?, ?, ?, ?, ?)",
+                (reminder['user_id'], reminder['channel_id'], reminder['end_time'], reminder['message'], reminder['duration'])
+            )
+        reminder['id'] = cursor.lastrowid
+        return reminder['id']
+
+    def delete(self, reminder_id):
+        """Delete a reminder by id, returns False if it was already gone"""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+        return cursor.rowcount > 0
+
+    def delete_many(self, reminder_ids):
+        """Delete several reminders in one transaction, returns the ids that existed"""
+        reminder_ids = list(reminder_ids)
+        deleted = set()
+        with self.conn:
+            # Stay well below SQLite's bound parameter limit
+            for start in range(0, len(reminder_ids), 500):
+                chunk = reminder_ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self.conn.execute(f"SELECT id FROM reminders WHERE id IN ({marks})", chunk)
+                deleted.update(row[0] for row in rows)
+                self.conn.execute(f"DELETE FROM reminders WHERE id IN ({marks})", chunk)
+        return deleted
+
+    def all(self):
+        """Return every stored reminder"""
+        return [dict(row) for row in self.conn.execute("SELECT * FROM reminders")]
+
+    def checkpoint(self):
+        """Fold the write-ahead log into the database and truncate it"""
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def import_yaml(self, path):
+        """One-time migration of the legacy reminders.yaml file"""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r") as f:
+                reminders = yaml.load(f, Loader=SafeLoader) or []
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO reminders (user_id, channel_id, end_time, message, duration) VALUES (?, ?, ?, ?, ?)",
+                    [(r['user_id'], r['channel_id'], r['end_time'], r['message'], r['duration']) for r in reminders]
+                )
+            # Keep the old file around but make sure it is never imported twice
+            os.replace(path, f"{path}.migrated")
+            print(f"Migrated {len(reminders)} reminders from {path}")
+            return len(reminders)
+        except Exception as e:
+            print(f"Failed to migrate reminders: {e}")
+            return 0
+
+# ----------------------
+# REMINDER REPOSITORY
+# ----------------------
+class ReminderRepository:
+    """Write-through cache in front of the reminder store"""
+
+    def __init__(self, store):
+        self.store = store
+        self._by_id = {}
+        self._by_user = {}  # user id -> {reminder id: reminder}
+        for reminder in store.all():
+            self._index(reminder)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def _index(self, reminder):
+        self._by_id[reminder['id']] = reminder
+        self._by_user.setdefault(reminder['user_id'], {})[reminder['id']] = reminder
+
+    def _unindex(self, reminder_id):
+        reminder = self._by_id.pop(reminder_id, None)
+        if reminder is None:
+            return
+        user_reminders = self._by_user[reminder['user_id']]
+        del user_reminders[reminder_id]
+        if not user_reminders:
+            del self._by_user[reminder['user_id']]
+
+    async def add(self, reminder):
+        """Store a new reminder, returns its id"""
+        reminder_id = await run_io(self.store.add, reminder)
+        self._index(reminder)
+        return reminder_id
+
+    async def delete(self, reminder_id):
+        """Delete a reminder, returns False if it was already gone"""
+        self._unindex(reminder_id)
+        return await run_io(self.store.delete, reminder_id)
+
+    async def delete_many(self, reminder_ids):
+        """Delete several reminders in one write, returns the ids that existed"""
+        reminder_ids = list(reminder_ids)
+        for reminder_id in reminder_ids:
+            self._unindex(reminder_id)
+        return await run_io(self.store.delete_many, reminder_ids)
+
+    def claim(self, reminder_ids):
+        """Take reminders out of memory for delivery, skipping any already claimed or deleted"""
+        claimed = []
+        for reminder_id in reminder_ids:
+            reminder = self._by_id.get(reminder_id)
+            if reminder is not None:
+                self._unindex(reminder_id)
+                claimed.append(reminder)
+        return claimed
+
+    def release(self, reminders):
+        """Put claimed reminders back, e.g. after a failed delivery"""
+        for reminder in reminders:
+            self._index(reminder)
+
+    def get(self, reminder_id):
+        return self._by_id.get(reminder_id)
+
+    def for_user(self, user_id):
+        """Return one user's reminders ordered by end_time"""
+        return sorted(self._by_user.get(user_id, {}).values(), key=lambda r: r['end_time'])
+
+    def due(self, now):
+        """Return reminders whose end_time has passed, oldest first"""
+        return sorted((r for r in self._by_id.values() if r['end_time'] <= now), key=lambda r: r['end_time'])
+
+    def upcoming(self, now):
+        """Return reminders that are not due yet"""
+        return [r for r in self._by_id.values() if r['end_time'] > now]
 
 # ----------------------
 # REMINDER UTILITIES
 # ----------------------
-def save_reminders(reminders):
-    """Save reminders to YAML file"""
-    try:
-        import yaml
-        with open(REMINDERS_FILE, "w") as f:
-            yaml.dump(reminders, f)
-    except Exception as e:
-        print(f"Failed to save reminders: {e}")
-
-def load_reminders():
-    """Load reminders from YAML file"""
-    try:
-        import yaml
-        with open(REMINDERS_FILE, "r") as f:
-            return yaml.safe_load(f) or []
-    except FileNotFoundError:
-        return []
-    except Exception as e:
-        print(f"Failed to load reminders: {e}")
-        return []
-
-async def delayed_send_reminder(bot, reminder, delay):
-    """Wait for remaining time before sending reminder"""
-    await asyncio.sleep(delay)
-    await send_reminder(bot, reminder)
-    
-    # Remove the reminder from storage with thread safety
-    async with reminders_lock:
-        reminders = load_reminders()
+async def complete_reminders(bot, reminders):
+    """Deliver a batch of due reminders, then remove the sent ones in one write"""
+    # Claiming in memory stops a second send; rows are only deleted once sent,
+    # so a crash or shutdown mid-delivery leaves them for the next catch-up
+    claimed = bot.reminders.claim(r['id'] for r in reminders)
+    sent = await deliver_reminders(bot, claimed)
+    bot.reminders.release(r for r in claimed if r['id'] not in sent)
+    if sent:
+        await bot.reminders.delete_many(sent)
+
+async def deliver_reminders(bot, reminders):
+    """Send reminders through a small worker pool, returns the ids that were sent"""
+    queue = asyncio.Queue()
+    for reminder in reminders:
+        queue.put_nowait(reminder)
+    sent = set()
+
+    async def worker():
+        while not queue.empty():
+            reminder = queue.get_nowait()
+            try:
+                if await send_reminder(bot, reminder):
+                    sent.add(reminder['id'])
+                else:
+                    print(f"Failed to send reminder {reminder['id']}: user and channel unreachable")
+            except Exception as e:
+                print(f"Failed to send reminder {reminder['id']}: {e}")
+
+    await asyncio.gather(*(worker() for _ in range(min(DELIVERY_CONCURRENCY, len(reminders)))))
+    return sent
+
+def start_reminders(bot):
+    """Catch up on overdue reminders and schedule the rest, once per process"""
+    scheduler = bot.reminder_scheduler
+    if scheduler.is_running():
+        return
+
+    now = time.time()
+    overdue = bot.reminders.due(now)
+    if overdue:
+        print(f"Catching up on {len(overdue)} overdue reminders")
+        bot.loop.create_task(complete_reminders(bot, overdue))
+
+    for reminder in bot.reminders.upcoming(now):
+        scheduler.schedule(reminder)
+    scheduler.start()
+    bot.loop.create_task(compact_reminders(bot))
+
+async def compact_reminders(bot):
+    """Periodically checkpoint the reminder database in the background"""
+    while True:
+        await asyncio.sleep(CHECKPOINT_INTERVAL)
         try:
-            reminders.remove(reminder)
-            save_reminders(reminders)
-        except ValueError:
-            pass  # Already removed
+            await run_io(bot.reminders.store.checkpoint)
+        except Exception as e:
+            print(f"Failed to checkpoint reminders: {e}")
+
+async def cancel_reminder(bot, reminder_id):
+    """Unschedule and delete a reminder, returns False if it was already gone"""
+    bot.reminder_scheduler.cancel(reminder_id)
+    return await bot.reminders.delete(reminder_id)
 
 async def send_reminder(bot, reminder):
-    """Send reminder to user"""
+    """Send reminder to user, returns False if neither the user nor the channel was reachable"""
     user = bot.get_user(reminder['user_id'])
+    if user is None:
+        # Members are not cached by default, so look the user up directly
+        try:
+            user = await bot.fetch_user(reminder['user_id'])
+        except discord.HTTPException:
+            user = None
     channel = bot.get_channel(reminder['channel_id'])
     
     if user:
         try:
             await user.send(f"## <a:hb_timer:1356310162616356945> Reminder! \n- **Reason:** {reminder['message']} `[after {reminder['duration']}]`")
+            return True
         except discord.Forbidden:
             if channel:
                 await channel.send(f"{user.mention}, I couldn't DM your reminder!", delete_after=10)
+                return True
     elif channel:
         await channel.send(f"## <a:hb_timer:1356310162616356945> Reminder! \n- **Reason:** {reminder['message']} `[after {reminder['duration']}]`")
+        return True
+    return False
 
 def has_remind_permission(ctx=None, interaction=None):
     """Check if user has permission to use reminder commands"""
@@ -75,6 +289,100 @@ def has_remind_permission(ctx=None, interaction=None):
         return interaction.user.guild_permissions.mute_members or any(role.id == 1288455526124097537 for role in interaction.user.roles)
     return False
 
+# ----------------------
+# REMINDER SCHEDULER
+# ----------------------
+class ReminderScheduler:
+    """Single background task that fires reminders in end_time order"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._heap = []
+        self._entries = {}  # reminder id -> heap entry
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, reminder_id):
+        return reminder_id in self._entries
+
+    def get(self, reminder_id):
+        """Return the pending reminder with this id, or None"""
+        entry = self._entries.get(reminder_id)
+        return entry[2] if entry else None
+
+    def is_running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the scheduler loop if it isn't already running"""
+        if not self.is_running():
+            self._task = self.bot.loop.create_task(self._run())
+
+    def schedule(self, reminder):
+        """Queue a reminder, replacing any pending entry with the same id"""
+        self.cancel(reminder['id'])
+        entry = [reminder['end_time'], next(self._counter), reminder]
+        self._entries[reminder['id']] = entry
+        heapq.heappush(self._heap, entry)
+        # Only wake the loop when the new reminder is due before the current head
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+    def cancel(self, reminder_id):
+        """Cancel a scheduled reminder, returns False if it isn't pending"""
+        entry = self._entries.get(reminder_id)
+        if entry is None:
+            return False
+        del self._entries[reminder_id]
+        entry[2] = None
+        self._cancelled += 1
+        # Rebuild once cancelled entries dominate so the heap stays bounded
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [e for e in self._heap if e[2] is not None]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        return True
+
+    def _pop_due(self, now):
+        """Pop every live reminder whose end_time has passed"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if entry[2] is None:
+                self._cancelled -= 1
+                continue
+            due.append(entry[2])
+            del self._entries[entry[2]['id']]
+            entry[2] = None
+        return due
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            due = self._pop_due(time.time())
+            if due:
+                self.bot.loop.create_task(complete_reminders(self.bot, due))
+
+            if len(self) == 0:
+                await self._wakeup.wait()
+                continue
+
+            # Drop cancelled entries so the timeout targets a live reminder
+            while self._heap[0][2] is None:
+                heapq.heappop(self._heap)
+                self._cancelled -= 1
+
+            delay = self._heap[0][0] - time.time()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(delay, 0))
+            except asyncio.TimeoutError:
+                pass
+
 # ----------------------
 # REMINDER PAGINATOR
 # ----------------------
@@ -139,8 +447,15 @@ class RemindersPaginator(discord.ui.View):
 # ----------------------
 def setup(bot):
     # Access bot's config
-    global REMINDERS_FILE
+    global REMINDERS_FILE, REMINDERS_DB, DELIVERY_CONCURRENCY, CHECKPOINT_INTERVAL
     REMINDERS_FILE = bot.config.get("reminders_file", "reminders.yaml")
+    REMINDERS_DB = bot.config.get("reminders_db", "reminders.db")
+    DELIVERY_CONCURRENCY = bot.config.get("reminder_delivery_concurrency", DELIVERY_CONCURRENCY)
+    CHECKPOINT_INTERVAL = bot.config.get("reminders_checkpoint_interval", CHECKPOINT_INTERVAL)
+    store = ReminderStore(REMINDERS_DB)
+    store.import_yaml(REMINDERS_FILE)
+    bot.reminders = ReminderRepository(store)
+    bot.reminder_scheduler = ReminderScheduler(bot)
     
     @bot.command(name='remind')
     async def remind_command(ctx, duration: str, *, message: str = None):
@@ -196,15 +511,10 @@ def setup(bot):
                 'duration': duration
             }
             
-            async with reminders_lock:
-                reminders = load_reminders()
-                reminders.append(reminder)
-                save_reminders(reminders)
+            await bot.reminders.add(reminder)
 
             # Schedule reminder
-            delay = end_time - time.time()
-            if delay > 0:
-                bot.loop.create_task(delayed_send_reminder(bot, reminder, delay))
+            bot.reminder_scheduler.schedule(reminder)
 
             embed = discord.Embed(
                 description=f"## <a:hb_timer:1356310162616356945> Reminder Successfully Set \n- **ends** <t:{end_time}:R>",
@@ -220,34 +530,30 @@ def setup(bot):
     # REMINDERS SLASH COMMAND
     # ----------------------
     class RemoveReminderDropdown(discord.ui.Select):
-        def __init__(self, reminders):
+        def __init__(self, reminders, page, pages):
             self.reminders = reminders
+            self.page = page
+            start = page * PAGE_SIZE
             options = [
                 discord.SelectOption(
                     label=f"Reminder {idx+1}",
                     description=f"{rem['message'][:50]}{'...' if len(rem['message']) > 50 else ''}",
-                    value=str(idx)
-                ) for idx, rem in enumerate(reminders)
+                    value=str(rem['id'])
+                ) for idx, rem in enumerate(reminders[start:start + PAGE_SIZE], start=start)
             ]
             super().__init__(
-                placeholder="Select a reminder to remove",
+                placeholder=f"Select a reminder to remove (page {page+1}/{pages})",
                 min_values=1,
                 max_values=1,
                 options=options
             )
         
         async def callback(self, interaction: discord.Interaction):
-            idx = int(self.values[0])
-            reminder = self.reminders.pop(idx)
+            reminder_id = int(self.values[0])
+            self.reminders = [r for r in self.reminders if r['id'] != reminder_id]
             
             # Update stored reminders
-            async with reminders_lock:
-                all_reminders = load_reminders()
-                try:
-                    all_reminders.remove(reminder)
-                    save_reminders(all_reminders)
-                except ValueError:
-                    pass
+            await cancel_reminder(bot, reminder_id)
             
             # Update message
             if not self.reminders:
@@ -262,13 +568,25 @@ def setup(bot):
                     description="Reminder removed successfully!",
                     color=BLUE
                 )
-                await interaction.response.edit_message(embed=embed, view=RemindersView(self.reminders))
+                await interaction.response.edit_message(embed=embed, view=RemindersView(self.reminders, self.page))
 
     class RemindersView(discord.ui.View):
-        def __init__(self, reminders):
+        def __init__(self, reminders, page=0):
             super().__init__()
             self.reminders = reminders
-            self.add_item(RemoveReminderDropdown(reminders))
+            self.pages = max(1, math.ceil(len(reminders) / PAGE_SIZE))
+            self.page = min(page, self.pages - 1)
+            self.prev_page.disabled = self.page <= 0
+            self.next_page.disabled = self.page >= self.pages - 1
+            self.add_item(RemoveReminderDropdown(reminders, self.page, self.pages))
+
+        @discord.ui.button(label="<", style=discord.ButtonStyle.primary)
+        async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await interaction.response.edit_message(view=RemindersView(self.reminders, self.page - 1))
+
+        @discord.ui.button(label=">", style=discord.ButtonStyle.primary)
+        async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await interaction.response.edit_message(view=RemindersView(self.reminders, self.page + 1))
         
         @discord.ui.button(label="Done", style=discord.ButtonStyle.green)
         async def done(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -287,9 +605,7 @@ def setup(bot):
             return
         
         # Get user's reminders
-        async with reminders_lock:
-            reminders = load_reminders()
-            user_reminders = [r for r in reminders if r['user_id'] == interaction.user.id]
+        user_reminders = bot.reminders.for_user(interaction.user.id)
         
         if not user_reminders:
             embed = discord.Embed(
@@ -0,0 +1,178 @@
+# snapshots.py
+import asyncio
+import base64
+import json
+import os
+import time
+import discord
+from fileio import atomic_write_json
+
+# ----------------------
+# CONSTANTS & CONFIG
+# ----------------------
+BLUE = 0x0000FF
+SNAPSHOT_DIR = "snapshots"
+SNAPSHOT_KEEP = 20  # Snapshots kept per guild, oldest are pruned
+
+# ----------------------
+# SNAPSHOT STORE
+# ----------------------
+class SnapshotStore:
+    """Channel snapshots as JSON files, one directory per guild"""
+
+    def __init__(self, directory=SNAPSHOT_DIR, keep=SNAPSHOT_KEEP):
+        self.directory = directory
+        self.keep = keep
+
+    def _guild_dir(self, guild_id):
+        return os.path.join(self.directory, str(guild_id))
+
+    def save(self, snapshot):
+        """Write a snapshot and return its id"""
+        snapshot_id = f"{snapshot['id']}-{snapshot['captured_at']}"
+        directory = self._guild_dir(snapshot["guild_id"])
+        os.makedirs(directory, exist_ok=True)
+        atomic_write_json(os.path.join(directory, f"{snapshot_id}.json"), snapshot)
+        for old_id in self.list(snapshot["guild_id"])[self.keep:]:
+            os.remove(os.path.join(directory, f"{old_id}.json"))
+        return snapshot_id
+
+    def load(self, guild_id, snapshot_id):
+        """Read a snapshot, or None if there is no such snapshot"""
+        path = os.path.join(self._guild_dir(guild_id), f"{os.path.basename(snapshot_id)}.json")
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def list(self, guild_id):
+        """Snapshot ids for a guild, newest first"""
+        try:
+            names = os.listdir(self._guild_dir(guild_id))
+        except FileNotFoundError:
+            return []
+        ids = [name[:-5] for name in names if name.endswith(".json") and not name.startswith(".")]
+        return sorted(ids, key=lambda snapshot_id: int(snapshot_id.rsplit("-", 1)[1]), reverse=True)
+
+# ----------------------
+# CAPTURE
+# ----------------------
+async def _capture_webhook(webhook):
+    avatar = None
+    if webhook.avatar:
+        try:
+            avatar = base64.b64encode(await webhook.avatar.read()).decode()
+        except discord.HTTPException:
+            pass
+    return {"name": webhook.name, "avatar": avatar}
+
+async def capture_channel(channel):
+    """Snapshot a text channel's configuration, pins and webhooks"""
+    async def webhooks():
+        try:
+            hooks = await channel.webhooks()
+        except discord.Forbidden:
+            return []  # Needs Manage Webhooks
+        return await asyncio.gather(*(_capture_webhook(hook) for hook in hooks if hook.type == discord.WebhookType.incoming))
+
+    pins, hooks = await asyncio.gather(channel.pins(), webhooks())
+    return {
+        "id": channel.id,
+        "guild_id": channel.guild.id,
+        "captured_at": int(time.time()),
+        "name": channel.name,
+        "topic": channel.topic,
+        "category_id": channel.category_id,
+        "position": channel.position,
+        "slowmode_delay": channel.slowmode_delay,
+        "nsfw": channel.nsfw,
+        "news": channel.is_news(),
+        "default_auto_archive_duration": channel.default_auto_archive_duration,
+        "default_thread_slowmode_delay": channel.default_thread_slowmode_delay,
+        "overwrites": [
+            {
+                "id": target.id,
+                "type": "role" if isinstance(target, discord.Role) else "member",
+                "allow": overwrite.pair()[0].value,
+                "deny": overwrite.pair()[1].value
+            }
+            for target, overwrite in channel.overwrites.items()
+        ],
+        # channel.pins() is newest first, keep them oldest first for re-posting
+        "pins": [
+            {
+                "author": str(message.author),
+                "author_avatar": message.author.display_avatar.url,
+                "content": message.content,
+                "attachments": [a.url for a in message.attachments],
+                "created_at": message.created_at.isoformat(),
+                "jump_url": message.jump_url
+            }
+            for message in reversed(pins)
+        ],
+        "webhooks": hooks
+    }
+
+# ----------------------
+# RESTORE
+# ----------------------
+def _overwrites(guild, snapshot):
+    overwrites = {}
+    for entry in snapshot["overwrites"]:
+        if entry["type"] == "role":
+            target = guild.get_role(entry["id"]) or discord.Object(id=entry["id"], type=discord.Role)
+        else:
+            target = guild.get_member(entry["id"]) or discord.Object(id=entry["id"], type=discord.Member)
+        overwrites[target] = discord.PermissionOverwrite.from_pair(
+            discord.Permissions(entry["allow"]), discord.Permissions(entry["deny"])
+        )
+    return overwrites
+
+def _pin_embed(pin):
+    embed = discord.Embed(
+        description=pin["content"] or None,
+        color=BLUE,
+        timestamp=discord.utils.parse_time(pin["created_at"])
+    )
+    embed.set_author(name=pin["author"], icon_url=pin["author_avatar"])
+    if pin["attachments"]:
+        embed.add_field(name="Attachments", value="\n".join(pin["attachments"])[:1024], inline=False)
+    return embed
+
+async def _restore_pins(channel, pins):
+    # Sequential so the pin order matches the original channel
+    for pin in pins:
+        message = await channel.send(embed=_pin_embed(pin))
+        await message.pin()
+
+async def _restore_webhook(channel, hook):
+    avatar = base64.b64decode(hook["avatar"]) if hook["avatar"] else None
+    await channel.create_webhook(name=hook["name"], avatar=avatar)
+
+async def restore_channel(guild, snapshot, reason=None):
+    """Create a text channel from a snapshot and return it"""
+    # Webhooks get new URLs, so anything posting to the old ones has to be updated
+    channel = await guild.create_text_channel(
+        name=snapshot["name"],
+        category=guild.get_channel(snapshot["category_id"]) if snapshot["category_id"] else None,
+        position=snapshot["position"],
+        topic=snapshot["topic"],
+        slowmode_delay=snapshot["slowmode_delay"],
+        nsfw=snapshot["nsfw"],
+        # Older snapshots were taken before these were captured
+        news=snapshot.get("news", False),
+        default_auto_archive_duration=snapshot["default_auto_archive_duration"],
+        default_thread_slowmode_delay=snapshot.get("default_thread_slowmode_delay", 0),
+        overwrites=_overwrites(guild, snapshot),
+        reason=reason
+    )
+    results = await asyncio.gather(
+        _restore_pins(channel, snapshot["pins"]),
+        *(_restore_webhook(channel, hook) for hook in snapshot["webhooks"]),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Error restoring channel {snapshot['name']}: {result}")
+    return channel